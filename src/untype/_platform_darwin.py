@@ -1,12 +1,15 @@
 """macOS implementation of platform-specific operations (stub).
 
 All functions raise ``NotImplementedError`` — macOS support is planned but
-not yet implemented.
+not yet implemented.  :class:`DigitKeyInterceptor` and
+:class:`ForegroundWatcher` are no-ops so the app can still construct them
+unconditionally.
 """
 
 from __future__ import annotations
 
 import tkinter as tk
+from typing import Callable
 
 from pynput.keyboard import Key
 
@@ -25,9 +28,62 @@ def verify_foreground_window(identity: WindowIdentity) -> bool:
     raise NotImplementedError("macOS support coming soon")
 
 
+def get_clipboard_sequence_number() -> int:
+    raise NotImplementedError("macOS support coming soon")
+
+
+def get_clipboard_text() -> str:
+    raise NotImplementedError("macOS support coming soon")
+
+
+def set_clipboard_text(text: str) -> None:
+    raise NotImplementedError("macOS support coming soon")
+
+
 def set_window_noactivate(tk_root: tk.Tk | tk.Toplevel) -> None:
     raise NotImplementedError("macOS support coming soon")
 
 
 def get_modifier_key() -> Key:
     raise NotImplementedError("macOS support coming soon")
+
+
+def send_key_combo(key: Key, char: str) -> None:
+    raise NotImplementedError("macOS support coming soon")
+
+
+def release_modifier_keys() -> None:
+    raise NotImplementedError("macOS support coming soon")
+
+
+class DigitKeyInterceptor:
+    """No-op stand-in: digit-key persona selection is not available yet."""
+
+    def __init__(self, on_digit: Callable[[int], None]) -> None:
+        self._on_digit = on_digit
+
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+    def set_active(self, active: bool) -> None:
+        pass
+
+
+class ForegroundWatcher:
+    """No-op stand-in: callers fall back to polling the foreground window."""
+
+    def __init__(self, on_change: Callable[[], None]) -> None:
+        self._on_change = on_change
+
+    @property
+    def installed(self) -> bool:
+        return False
+
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
@@ -6,6 +6,7 @@ import ctypes
 import ctypes.wintypes
 import logging
 import threading
+import time
 import tkinter as tk
 from typing import Callable
 
@@ -50,11 +51,142 @@ class GUITHREADINFO(ctypes.Structure):
     ]
 
 
+# ---------------------------------------------------------------------------
+# Pre-bound user32 prototypes
+# ---------------------------------------------------------------------------
+
+# Private user32 instance (like ``_hook_user32`` below) so the argtypes we
+# declare here don't leak into pynput, which shares ``ctypes.windll.user32``.
+# Explicit argtypes/restype let ctypes skip its generic argument coercion.
+_api_user32 = ctypes.WinDLL("user32", use_last_error=True)
+
+_GetForegroundWindow = _api_user32.GetForegroundWindow
+_GetForegroundWindow.argtypes = []
+_GetForegroundWindow.restype = ctypes.wintypes.HWND
+
+_IsWindow = _api_user32.IsWindow
+_IsWindow.argtypes = [ctypes.wintypes.HWND]
+_IsWindow.restype = ctypes.wintypes.BOOL
+
+_GetWindowThreadProcessId = _api_user32.GetWindowThreadProcessId
+_GetWindowThreadProcessId.argtypes = [ctypes.wintypes.HWND, ctypes.POINTER(ctypes.wintypes.DWORD)]
+_GetWindowThreadProcessId.restype = ctypes.wintypes.DWORD
+
+_GetGUIThreadInfo = _api_user32.GetGUIThreadInfo
+_GetGUIThreadInfo.argtypes = [ctypes.wintypes.DWORD, ctypes.POINTER(GUITHREADINFO)]
+_GetGUIThreadInfo.restype = ctypes.wintypes.BOOL
+
+_ClientToScreen = _api_user32.ClientToScreen
+_ClientToScreen.argtypes = [ctypes.wintypes.HWND, ctypes.POINTER(POINT)]
+_ClientToScreen.restype = ctypes.wintypes.BOOL
+
+_GetCursorPos = _api_user32.GetCursorPos
+_GetCursorPos.argtypes = [ctypes.POINTER(POINT)]
+_GetCursorPos.restype = ctypes.wintypes.BOOL
+
+_GetWindowTextLengthW = _api_user32.GetWindowTextLengthW
+_GetWindowTextLengthW.argtypes = [ctypes.wintypes.HWND]
+_GetWindowTextLengthW.restype = ctypes.c_int
+
+_GetWindowTextW = _api_user32.GetWindowTextW
+_GetWindowTextW.argtypes = [ctypes.wintypes.HWND, ctypes.wintypes.LPWSTR, ctypes.c_int]
+_GetWindowTextW.restype = ctypes.c_int
+
+_GetClipboardSequenceNumber = _api_user32.GetClipboardSequenceNumber
+_GetClipboardSequenceNumber.argtypes = []
+_GetClipboardSequenceNumber.restype = ctypes.wintypes.DWORD
+
+_CreateWindowExW = _api_user32.CreateWindowExW
+_CreateWindowExW.argtypes = [
+    ctypes.wintypes.DWORD,
+    ctypes.wintypes.LPCWSTR,
+    ctypes.wintypes.LPCWSTR,
+    ctypes.wintypes.DWORD,
+    ctypes.c_int,
+    ctypes.c_int,
+    ctypes.c_int,
+    ctypes.c_int,
+    ctypes.wintypes.HWND,
+    ctypes.wintypes.HMENU,
+    ctypes.wintypes.HINSTANCE,
+    ctypes.wintypes.LPVOID,
+]
+_CreateWindowExW.restype = ctypes.wintypes.HWND
+
+_DestroyWindow = _api_user32.DestroyWindow
+_DestroyWindow.argtypes = [ctypes.wintypes.HWND]
+_DestroyWindow.restype = ctypes.wintypes.BOOL
+
+_OpenClipboard = _api_user32.OpenClipboard
+_OpenClipboard.argtypes = [ctypes.wintypes.HWND]
+_OpenClipboard.restype = ctypes.wintypes.BOOL
+
+_CloseClipboard = _api_user32.CloseClipboard
+_CloseClipboard.argtypes = []
+_CloseClipboard.restype = ctypes.wintypes.BOOL
+
+_EmptyClipboard = _api_user32.EmptyClipboard
+_EmptyClipboard.argtypes = []
+_EmptyClipboard.restype = ctypes.wintypes.BOOL
+
+_IsClipboardFormatAvailable = _api_user32.IsClipboardFormatAvailable
+_IsClipboardFormatAvailable.argtypes = [ctypes.wintypes.UINT]
+_IsClipboardFormatAvailable.restype = ctypes.wintypes.BOOL
+
+_GetClipboardData = _api_user32.GetClipboardData
+_GetClipboardData.argtypes = [ctypes.wintypes.UINT]
+_GetClipboardData.restype = ctypes.wintypes.HANDLE
+
+_SetClipboardData = _api_user32.SetClipboardData
+_SetClipboardData.argtypes = [ctypes.wintypes.UINT, ctypes.wintypes.HANDLE]
+_SetClipboardData.restype = ctypes.wintypes.HANDLE
+
+_api_kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+_GlobalAlloc = _api_kernel32.GlobalAlloc
+_GlobalAlloc.argtypes = [ctypes.wintypes.UINT, ctypes.c_size_t]
+_GlobalAlloc.restype = ctypes.wintypes.HGLOBAL
+
+_GlobalFree = _api_kernel32.GlobalFree
+_GlobalFree.argtypes = [ctypes.wintypes.HGLOBAL]
+_GlobalFree.restype = ctypes.wintypes.HGLOBAL
+
+_GlobalLock = _api_kernel32.GlobalLock
+_GlobalLock.argtypes = [ctypes.wintypes.HGLOBAL]
+_GlobalLock.restype = ctypes.wintypes.LPVOID
+
+_GlobalUnlock = _api_kernel32.GlobalUnlock
+_GlobalUnlock.argtypes = [ctypes.wintypes.HGLOBAL]
+_GlobalUnlock.restype = ctypes.wintypes.BOOL
+
+
 # ---------------------------------------------------------------------------
 # Caret position
 # ---------------------------------------------------------------------------
 
 
+# Per-thread scratch structures reused across caret lookups.  Callers only
+# ever see the plain ints copied into CaretPosition, so reuse is safe.
+_tls = threading.local()
+
+_GUITHREADINFO_SIZE = ctypes.sizeof(GUITHREADINFO)
+
+
+def _caret_scratch() -> tuple[GUITHREADINFO, POINT]:
+    """Return this thread's reusable ``(GUITHREADINFO, POINT)`` pair."""
+    gui = getattr(_tls, "gui", None)
+    if gui is None:
+        gui = _tls.gui = GUITHREADINFO()
+        _tls.pt = POINT()
+    return gui, _tls.pt
+
+
+def _cursor_position(pt: POINT) -> CaretPosition:
+    """Return the mouse cursor position as a (not-found) caret fallback."""
+    _GetCursorPos(ctypes.byref(pt))
+    return CaretPosition(x=pt.x, y=pt.y, found=False)
+
+
 def get_caret_screen_position() -> CaretPosition:
     """Return the screen position of the text caret.
 
@@ -62,35 +194,32 @@ def get_caret_screen_position() -> CaretPosition:
     application doesn't expose a Win32 caret (common with modern apps), falls
     back to the current mouse cursor position.
     """
+    gui, pt = _caret_scratch()
+
     # Try GetGUIThreadInfo for the foreground thread.
-    hwnd = user32.GetForegroundWindow()
+    hwnd = _GetForegroundWindow()
 
     # Validate HWND before using it
-    if not hwnd or not user32.IsWindow(hwnd):
+    if not hwnd or not _IsWindow(hwnd):
         logger.debug("get_caret_screen_position: invalid HWND, falling back to mouse")
-        pt = POINT()
-        user32.GetCursorPos(ctypes.byref(pt))
-        return CaretPosition(x=pt.x, y=pt.y, found=False)
+        return _cursor_position(pt)
 
-    tid = user32.GetWindowThreadProcessId(hwnd, None)
+    tid = _GetWindowThreadProcessId(hwnd, None)
     if not tid:
         logger.debug("get_caret_screen_position: failed to get thread ID, falling back to mouse")
-        pt = POINT()
-        user32.GetCursorPos(ctypes.byref(pt))
-        return CaretPosition(x=pt.x, y=pt.y, found=False)
+        return _cursor_position(pt)
 
-    gui = GUITHREADINFO()
-    gui.cbSize = ctypes.sizeof(GUITHREADINFO)
+    ctypes.memset(ctypes.byref(gui), 0, _GUITHREADINFO_SIZE)
+    gui.cbSize = _GUITHREADINFO_SIZE
 
-    if user32.GetGUIThreadInfo(tid, ctypes.byref(gui)) and gui.hwndCaret:
-        pt = POINT(gui.rcCaret.left, gui.rcCaret.top)
-        if user32.ClientToScreen(gui.hwndCaret, ctypes.byref(pt)):
+    if _GetGUIThreadInfo(tid, ctypes.byref(gui)) and gui.hwndCaret:
+        pt.x = gui.rcCaret.left
+        pt.y = gui.rcCaret.top
+        if _ClientToScreen(gui.hwndCaret, ctypes.byref(pt)):
             return CaretPosition(x=pt.x, y=pt.y, found=True)
 
     # Fallback: mouse cursor position.
-    pt = POINT()
-    user32.GetCursorPos(ctypes.byref(pt))
-    return CaretPosition(x=pt.x, y=pt.y, found=False)
+    return _cursor_position(pt)
 
 
 # ---------------------------------------------------------------------------
@@ -98,28 +227,43 @@ def get_caret_screen_position() -> CaretPosition:
 # ---------------------------------------------------------------------------
 
 
+_TITLE_BUF_LEN = 512
+
+
+def _title_buffer() -> ctypes.Array[ctypes.c_wchar]:
+    """Return this thread's reusable window-title buffer."""
+    buf = getattr(_tls, "title_buf", None)
+    if buf is None:
+        buf = _tls.title_buf = ctypes.create_unicode_buffer(_TITLE_BUF_LEN)
+    return buf
+
+
 def get_foreground_window() -> WindowIdentity:
     """Take a snapshot of the current foreground window (HWND + PID + title).
 
     Returns an empty WindowIdentity (hwnd=0, title="", pid=0) if no valid
     foreground window exists.
     """
-    hwnd = user32.GetForegroundWindow()
+    hwnd = _GetForegroundWindow()
 
     # Validate HWND before using it
-    if not hwnd or not user32.IsWindow(hwnd):
+    if not hwnd or not _IsWindow(hwnd):
         logger.debug("get_foreground_window: invalid HWND returned")
         return WindowIdentity(hwnd=0, title="", pid=0)
 
-    # Window title.
-    length = user32.GetWindowTextLengthW(hwnd)
-    buf = ctypes.create_unicode_buffer(length + 1)
-    user32.GetWindowTextW(hwnd, buf, length + 1)
+    # Window title: read straight into the per-thread buffer and only probe
+    # the real length when the title may have been truncated.
+    buf = _title_buffer()
+    n = _GetWindowTextW(hwnd, buf, _TITLE_BUF_LEN)
+    if n >= _TITLE_BUF_LEN - 1:
+        length = _GetWindowTextLengthW(hwnd)
+        buf = ctypes.create_unicode_buffer(length + 1)
+        _GetWindowTextW(hwnd, buf, length + 1)
     title = buf.value
 
     # Process ID.
     pid = ctypes.wintypes.DWORD()
-    user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+    _GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
 
     return WindowIdentity(hwnd=hwnd, title=title, pid=pid.value)
 
@@ -130,8 +274,132 @@ def verify_foreground_window(identity: WindowIdentity) -> bool:
     Compares both the HWND and the PID to handle the (rare) case where a
     window handle is reused by the OS for a different process.
     """
-    current = get_foreground_window()
-    return current.hwnd == identity.hwnd and current.pid == identity.pid
+    hwnd, pid = _get_fg_hwnd_pid()
+    return hwnd == identity.hwnd and pid == identity.pid
+
+
+def _get_fg_hwnd_pid() -> tuple[int, int]:
+    """Return ``(hwnd, pid)`` of the foreground window without reading its title.
+
+    Returns ``(0, 0)`` if no valid foreground window exists, matching the
+    empty identity produced by :func:`get_foreground_window`.
+    """
+    hwnd = _GetForegroundWindow()
+    if not hwnd or not _IsWindow(hwnd):
+        return 0, 0
+    pid = ctypes.wintypes.DWORD()
+    _GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+    return hwnd, pid.value
+
+
+# ---------------------------------------------------------------------------
+# Clipboard change detection
+# ---------------------------------------------------------------------------
+
+
+def get_clipboard_sequence_number() -> int:
+    """Return the clipboard sequence number (bumped on every clipboard write)."""
+    return _GetClipboardSequenceNumber()
+
+
+# ---------------------------------------------------------------------------
+# Clipboard text (direct user32 access, bypassing pyperclip)
+# ---------------------------------------------------------------------------
+
+CF_UNICODETEXT = 13
+GMEM_MOVEABLE = 0x0002
+HWND_MESSAGE = -3
+
+# Other processes may hold the clipboard open briefly; retry for ~500 ms
+# (the same budget pyperclip uses).
+_CLIPBOARD_OPEN_TIMEOUT = 0.5
+_CLIPBOARD_OPEN_DELAY = 0.01
+
+
+def _open_clipboard() -> int:
+    """Open the clipboard, retrying while another process holds it.
+
+    A hidden message-only window is created as the clipboard owner
+    (``SetClipboardData`` may fail after ``EmptyClipboard`` without one)
+    and returned; pass it to :func:`_close_clipboard`.  The window only
+    lives for the one operation, so no idle owner is left behind to
+    receive ``WM_DESTROYCLIPBOARD`` on a thread that never pumps messages.
+    """
+    hwnd = _CreateWindowExW(0, "STATIC", None, 0, 0, 0, 0, 0, HWND_MESSAGE, None, None, None)
+    if not hwnd:
+        raise OSError(ctypes.get_last_error(), "CreateWindowExW failed")
+    deadline = time.monotonic() + _CLIPBOARD_OPEN_TIMEOUT
+    while not _OpenClipboard(hwnd):
+        if time.monotonic() >= deadline:
+            err = ctypes.get_last_error()
+            _DestroyWindow(hwnd)
+            raise OSError(err, "OpenClipboard failed")
+        time.sleep(_CLIPBOARD_OPEN_DELAY)
+    return hwnd
+
+
+def _close_clipboard(hwnd: int) -> None:
+    """Close the clipboard and destroy the owner window from :func:`_open_clipboard`."""
+    try:
+        _CloseClipboard()
+    finally:
+        _DestroyWindow(hwnd)
+
+
+def get_clipboard_text() -> str:
+    """Return the clipboard's Unicode text, or ``""`` if it holds no text.
+
+    Raises:
+        OSError: If the clipboard cannot be opened or read.
+    """
+    hwnd = _open_clipboard()
+    try:
+        if not _IsClipboardFormatAvailable(CF_UNICODETEXT):
+            return ""
+        handle = _GetClipboardData(CF_UNICODETEXT)
+        if not handle:
+            return ""
+        ptr = _GlobalLock(handle)
+        if not ptr:
+            raise OSError(ctypes.get_last_error(), "GlobalLock failed")
+        try:
+            return ctypes.wstring_at(ptr)
+        finally:
+            _GlobalUnlock(handle)
+    finally:
+        _close_clipboard(hwnd)
+
+
+def set_clipboard_text(text: str) -> None:
+    """Replace the clipboard contents with *text* (empty string clears it).
+
+    Raises:
+        OSError: If the clipboard cannot be opened or written.
+    """
+    hwnd = _open_clipboard()
+    try:
+        if not _EmptyClipboard():
+            raise OSError(ctypes.get_last_error(), "EmptyClipboard failed")
+        if not text:
+            return
+
+        data = text.encode("utf-16-le") + b"\x00\x00"
+        handle = _GlobalAlloc(GMEM_MOVEABLE, len(data))
+        if not handle:
+            raise OSError(ctypes.get_last_error(), "GlobalAlloc failed")
+        ptr = _GlobalLock(handle)
+        if not ptr:
+            _GlobalFree(handle)
+            raise OSError(ctypes.get_last_error(), "GlobalLock failed")
+        ctypes.memmove(ptr, data, len(data))
+        _GlobalUnlock(handle)
+
+        # On success the system owns the memory; only free it on failure.
+        if not _SetClipboardData(CF_UNICODETEXT, handle):
+            _GlobalFree(handle)
+            raise OSError(ctypes.get_last_error(), "SetClipboardData failed")
+    finally:
+        _close_clipboard(hwnd)
 
 
 # ---------------------------------------------------------------------------
@@ -172,6 +440,122 @@ def get_modifier_key() -> Key:
     return Key.ctrl_l
 
 
+# ---------------------------------------------------------------------------
+# Synthetic key input (SendInput)
+# ---------------------------------------------------------------------------
+
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+
+_ULONG_PTR = ctypes.c_size_t
+
+
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", ctypes.wintypes.LONG),
+        ("dy", ctypes.wintypes.LONG),
+        ("mouseData", ctypes.wintypes.DWORD),
+        ("dwFlags", ctypes.wintypes.DWORD),
+        ("time", ctypes.wintypes.DWORD),
+        ("dwExtraInfo", _ULONG_PTR),
+    ]
+
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", ctypes.wintypes.WORD),
+        ("wScan", ctypes.wintypes.WORD),
+        ("dwFlags", ctypes.wintypes.DWORD),
+        ("time", ctypes.wintypes.DWORD),
+        ("dwExtraInfo", _ULONG_PTR),
+    ]
+
+
+class HARDWAREINPUT(ctypes.Structure):
+    _fields_ = [
+        ("uMsg", ctypes.wintypes.DWORD),
+        ("wParamL", ctypes.wintypes.WORD),
+        ("wParamH", ctypes.wintypes.WORD),
+    ]
+
+
+class _INPUTUNION(ctypes.Union):
+    # MOUSEINPUT is the largest member and fixes sizeof(INPUT).
+    _fields_ = [("mi", MOUSEINPUT), ("ki", KEYBDINPUT), ("hi", HARDWAREINPUT)]
+
+
+class INPUT(ctypes.Structure):
+    _fields_ = [("type", ctypes.wintypes.DWORD), ("u", _INPUTUNION)]
+
+
+_INPUT_SIZE = ctypes.sizeof(INPUT)
+
+_SendInput = _api_user32.SendInput
+_SendInput.argtypes = [ctypes.wintypes.UINT, ctypes.POINTER(INPUT), ctypes.c_int]
+_SendInput.restype = ctypes.wintypes.UINT
+
+_VkKeyScanW = _api_user32.VkKeyScanW
+_VkKeyScanW.argtypes = [ctypes.wintypes.WCHAR]
+_VkKeyScanW.restype = ctypes.c_short
+
+
+def _build_key_inputs(events: list[tuple[int, bool]]) -> ctypes.Array[INPUT]:
+    """Build an ``INPUT`` array from ``(virtual_key, key_up)`` pairs."""
+    inputs = (INPUT * len(events))()
+    for i, (vk, key_up) in enumerate(events):
+        inputs[i].type = INPUT_KEYBOARD
+        inputs[i].u.ki.wVk = vk
+        if key_up:
+            inputs[i].u.ki.dwFlags = KEYEVENTF_KEYUP
+    return inputs
+
+
+def _send_inputs(inputs: ctypes.Array[INPUT]) -> None:
+    """Inject *inputs* in order with one ``SendInput`` call.
+
+    Raises:
+        OSError: If the system injected fewer events than requested (e.g.
+            blocked by UIPI).
+    """
+    count = len(inputs)
+    sent = _SendInput(count, inputs, _INPUT_SIZE)
+    if sent != count:
+        raise OSError(ctypes.get_last_error(), f"SendInput injected {sent}/{count} events")
+
+
+# Key-up events for every left/right Alt, Ctrl, Shift and Win key, built once.
+_RELEASE_MODIFIERS = _build_key_inputs(
+    [
+        (0xA4, True),  # VK_LMENU
+        (0xA5, True),  # VK_RMENU
+        (0xA2, True),  # VK_LCONTROL
+        (0xA3, True),  # VK_RCONTROL
+        (0xA0, True),  # VK_LSHIFT
+        (0xA1, True),  # VK_RSHIFT
+        (0x5B, True),  # VK_LWIN
+        (0x5C, True),  # VK_RWIN
+    ]
+)
+
+
+def release_modifier_keys() -> None:
+    """Send key-up events for all common modifier keys in one ``SendInput`` call."""
+    _send_inputs(_RELEASE_MODIFIERS)
+
+
+def send_key_combo(key: Key, char: str) -> None:
+    """Press and release *key* + *char* (e.g. Ctrl+V) as one atomic input burst.
+
+    ``SendInput`` queues all four events in order, so no delays are needed
+    between them.
+    """
+    mod_vk = key.value.vk
+    char_vk = _VkKeyScanW(char) & 0xFF
+    _send_inputs(
+        _build_key_inputs([(mod_vk, False), (char_vk, False), (char_vk, True), (mod_vk, True)])
+    )
+
+
 # ---------------------------------------------------------------------------
 # Digit key interceptor (low-level keyboard hook)
 # ---------------------------------------------------------------------------
@@ -320,3 +704,129 @@ class DigitKeyInterceptor:
         _hook_user32.UnhookWindowsHookEx(self._hook)
         self._hook = None
         logger.debug("Digit key interceptor hook removed")
+
+
+# ---------------------------------------------------------------------------
+# Foreground window watcher (WinEvent hook)
+# ---------------------------------------------------------------------------
+
+EVENT_SYSTEM_FOREGROUND = 0x0003
+WINEVENT_OUTOFCONTEXT = 0x0000
+
+WINEVENTPROC = ctypes.WINFUNCTYPE(
+    None,
+    ctypes.wintypes.HANDLE,  # hWinEventHook
+    ctypes.wintypes.DWORD,  # event
+    ctypes.wintypes.HWND,  # hwnd
+    ctypes.wintypes.LONG,  # idObject
+    ctypes.wintypes.LONG,  # idChild
+    ctypes.wintypes.DWORD,  # dwEventThread
+    ctypes.wintypes.DWORD,  # dwmsEventTime
+)
+
+_hook_user32.SetWinEventHook.argtypes = [
+    ctypes.wintypes.DWORD,
+    ctypes.wintypes.DWORD,
+    ctypes.wintypes.HMODULE,
+    WINEVENTPROC,
+    ctypes.wintypes.DWORD,
+    ctypes.wintypes.DWORD,
+    ctypes.wintypes.DWORD,
+]
+_hook_user32.SetWinEventHook.restype = ctypes.wintypes.HANDLE
+_hook_user32.UnhookWinEvent.argtypes = [ctypes.wintypes.HANDLE]
+_hook_user32.UnhookWinEvent.restype = ctypes.wintypes.BOOL
+
+
+class ForegroundWatcher:
+    """Report foreground-window changes via an ``EVENT_SYSTEM_FOREGROUND`` hook.
+
+    ``on_change()`` is called (on the hook thread) whenever another window
+    comes to the foreground, so callers need not poll.  Like
+    :class:`DigitKeyInterceptor`, the hook lives on its own daemon thread
+    with a Win32 message pump.
+    """
+
+    def __init__(self, on_change: Callable[[], None]) -> None:
+        self._on_change = on_change
+        self._hook: int | None = None
+        self._thread_id: int | None = None
+        self._thread: threading.Thread | None = None
+        # Must hold a reference to prevent garbage collection of the callback.
+        self._event_proc = WINEVENTPROC(self._handler)
+
+    @property
+    def installed(self) -> bool:
+        """``True`` while the hook is installed and events are delivered."""
+        return bool(self._hook)
+
+    def start(self) -> None:
+        """Start the hook thread (idempotent)."""
+        if self._thread is not None:
+            return
+        ready = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(ready,),
+            name="untype-foreground-hook",
+            daemon=True,
+        )
+        self._thread.start()
+        ready.wait(timeout=5.0)
+
+    def stop(self) -> None:
+        """Post ``WM_QUIT`` to the hook thread's message pump and wait for cleanup."""
+        tid = self._thread_id
+        thread = self._thread
+        if tid is not None:
+            user32.PostThreadMessageW(tid, WM_QUIT, 0, 0)
+            self._thread_id = None
+            self._thread = None
+            if thread is not None:
+                thread.join(timeout=1.0)
+
+    # -- internal ---------------------------------------------------------
+
+    def _handler(
+        self,
+        hWinEventHook: int,  # noqa: ARG002
+        event: int,  # noqa: ARG002
+        hwnd: int,  # noqa: ARG002
+        idObject: int,  # noqa: ARG002
+        idChild: int,  # noqa: ARG002
+        dwEventThread: int,  # noqa: ARG002
+        dwmsEventTime: int,  # noqa: ARG002
+    ) -> None:
+        try:
+            self._on_change()
+        except Exception:
+            logger.debug("on_change callback error", exc_info=True)
+
+    def _run(self, ready: threading.Event) -> None:
+        """Thread entry: install hook, pump messages, unhook on WM_QUIT."""
+        self._thread_id = kernel32.GetCurrentThreadId()
+        self._hook = _hook_user32.SetWinEventHook(
+            EVENT_SYSTEM_FOREGROUND,
+            EVENT_SYSTEM_FOREGROUND,
+            None,
+            self._event_proc,
+            0,
+            0,
+            WINEVENT_OUTOFCONTEXT,
+        )
+        if not self._hook:
+            logger.error("SetWinEventHook failed for foreground watcher")
+            ready.set()
+            return
+
+        logger.debug("Foreground watcher hook installed (thread %d)", self._thread_id)
+        ready.set()
+
+        msg = ctypes.wintypes.MSG()
+        while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+            user32.TranslateMessage(ctypes.byref(msg))
+            user32.DispatchMessageW(ctypes.byref(msg))
+
+        _hook_user32.UnhookWinEvent(self._hook)
+        self._hook = None
+        logger.debug("Foreground watcher hook removed")
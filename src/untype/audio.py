@@ -6,12 +6,17 @@ in memory -- nothing ever touches disk.
 
 from __future__ import annotations
 
+import logging
 import threading
 import time
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
 
 import numpy as np
-import sounddevice as sd
+
+if TYPE_CHECKING:
+    import sounddevice as sd
+
+logger = logging.getLogger(__name__)
 
 
 class AudioRecorder:
@@ -52,65 +57,109 @@ class AudioRecorder:
 
         self._lock = threading.Lock()
         self._stream: sd.InputStream | None = None
-        self._chunks: list[np.ndarray] = []
+        # Pre-allocated capture buffer, sized for MAX_RECORDING_SECONDS and
+        # reused across recordings.  The audio callback copies frames
+        # straight into it at ``_write``; only one producer (the audio
+        # thread) ever advances the offset.
+        self._buf: np.ndarray | None = None
+        self._write = 0
         self._start_time: float | None = None
+        # The stream stays open between recordings; this tracks whether it
+        # is currently capturing.
+        self._recording = False
+        # Number of samples returned by the most recent stop().
+        self.last_sample_count = 0
 
     # -- public API -----------------------------------------------------------
 
     def start(self) -> None:
         """Start recording audio from the microphone.
 
+        The input stream is opened on the first call and kept open (but
+        stopped) between recordings, so later calls only restart it.
+
         Raises
         ------
         RuntimeError
             If the configured device doesn't exist or is unavailable.
         """
+        import sounddevice as sd
+
         with self._lock:
-            if self._stream is not None:
+            if self._recording:
                 raise RuntimeError("Recording is already in progress")
 
-            # Validate device exists and is an input device
-            self._validate_device()
-
-            self._chunks = []
+            capacity = self.capacity
+            if self._buf is None or self._buf.shape[0] != capacity:
+                self._buf = np.empty(capacity, dtype=np.float32)
+            self._write = 0
             self._start_time = time.time()
             try:
-                self._stream = sd.InputStream(
-                    samplerate=self.sample_rate,
-                    channels=1,
-                    dtype="float32",
-                    device=self.device,
-                    callback=self._audio_callback,
-                )
+                if self._stream is None:
+                    # Validate device exists and is an input device
+                    self._validate_device()
+                    self._stream = sd.InputStream(
+                        samplerate=self.sample_rate,
+                        channels=1,
+                        dtype="float32",
+                        device=self.device,
+                        callback=self._audio_callback,
+                    )
                 self._stream.start()
             except sd.PortAudioError as e:
+                # The cached stream may be stale (e.g. device unplugged);
+                # drop it so the next start() reopens the device.
+                self._close_stream()
                 raise RuntimeError(
                     f"Failed to open audio device '{self.device or 'default'}': {e}"
                 ) from e
+            self._recording = True
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of samples a single recording can hold."""
+        return int(self.sample_rate * self.MAX_RECORDING_SECONDS)
 
-    def stop(self) -> np.ndarray:
+    def stop(self, out: np.ndarray | None = None) -> np.ndarray:
         """Stop recording and return the captured audio as a Float32 array.
 
+        Parameters
+        ----------
+        out:
+            Optional 1-D float32 array of at least :attr:`capacity` samples.
+            The audio is copied into it and a view of the filled prefix is
+            returned, so callers can reuse one buffer across recordings.
+            A new array is allocated when omitted.
+
         Returns
         -------
         numpy.ndarray
-            1-D float32 array of audio samples.
+            1-D float32 array of audio samples.  Its length is also stored
+            in :attr:`last_sample_count`.
         """
+        if out is not None and (
+            out.dtype != np.float32 or out.ndim != 1 or out.shape[0] < self.capacity
+        ):
+            raise ValueError("out must be a 1-D float32 array of at least `capacity` samples")
+
         with self._lock:
-            if self._stream is None:
+            if not self._recording or self._stream is None:
                 raise RuntimeError("Recording has not been started")
 
             self._stream.stop()
-            self._stream.close()
-            self._stream = None
-
-            if not self._chunks:
+            self._recording = False
+
+            # The stream is stopped, so the callback can no longer write.
+            # Copy out the filled region because the buffer is reused.
+            n = self._write
+            self._write = 0
+            self.last_sample_count = n
+            if n == 0 or self._buf is None:
                 return np.empty(0, dtype=np.float32)
-
-            # np.concatenate of 1D arrays returns a 1D array, no need to flatten
-            audio = np.concatenate(self._chunks)
-            self._chunks = []
-            return audio
+            if out is None:
+                return self._buf[:n].copy()
+            np.copyto(out[:n], self._buf[:n])
+            return out[:n]
 
     def abort(self) -> None:
         """Abort recording immediately without waiting for audio callback.
@@ -120,22 +169,30 @@ class AudioRecorder:
         already captured is discarded.
         """
         with self._lock:
-            if self._stream is None:
+            if not self._recording or self._stream is None:
                 return
 
             try:
-                # Close the stream directly - this aborts the audio callback immediately
-                self._stream.close()
+                # abort() drops pending buffers instead of draining them
+                self._stream.abort()
             except Exception:
-                pass  # Ignore errors during abort
-            self._stream = None
-            self._chunks = []  # Discard any captured audio
+                self._close_stream()  # Unknown state: reopen on next start()
+            self._recording = False
+            self._write = 0  # Discard any captured audio
+
+    def close(self) -> None:
+        """Release the audio device.  Any recording in progress is discarded."""
+        with self._lock:
+            self._close_stream()
+            self._recording = False
+            self._write = 0
 
     @property
     def is_recording(self) -> bool:
         """``True`` while the recorder is actively capturing audio."""
-        with self._lock:
-            return self._stream is not None
+        # Lock-free: a single attribute read is atomic, and pollers (UI,
+        # timeout monitor) must never contend with start()/stop().
+        return self._recording
 
     def get_duration(self) -> float:
         """Get the current recording duration in seconds.
@@ -145,13 +202,23 @@ class AudioRecorder:
         float
             Duration in seconds, or 0.0 if not recording.
         """
-        with self._lock:
-            if self._start_time is None:
-                return 0.0
-            return time.time() - self._start_time
+        start_time = self._start_time
+        if start_time is None:
+            return 0.0
+        return time.time() - start_time
 
     # -- internals ------------------------------------------------------------
 
+    def _close_stream(self) -> None:
+        """Close and forget the input stream (caller holds ``_lock``)."""
+        if self._stream is None:
+            return
+        try:
+            self._stream.close()
+        except Exception:
+            pass  # Ignore errors during close
+        self._stream = None
+
     def _validate_device(self) -> None:
         """Validate that the configured device exists and is an input device.
 
@@ -164,6 +231,8 @@ class AudioRecorder:
             # None = system default, let sounddevice handle it
             return
 
+        import sounddevice as sd
+
         try:
             device_info = sd.query_devices(self.device)
         except (ValueError, sd.PortAudioError) as e:
@@ -195,16 +264,26 @@ class AudioRecorder:
         if status:
             # Silently drop overflow/underflow info; could be logged later.
             pass
-        # indata is only valid inside the callback, so copy.
-        chunk = indata.copy()
-        with self._lock:
-            self._chunks.append(chunk)
+        buf = self._buf
+        if buf is None:
+            return
+
+        # indata is only valid inside the callback, so copy it into the
+        # pre-allocated buffer.  No lock needed: this thread is the only
+        # writer, and stop() reads _write only after the stream is stopped.
+        start = self._write
+        n = min(indata.shape[0], buf.shape[0] - start)
+        if n <= 0:
+            return  # Buffer full -- the timeout monitor will stop us shortly
+        end = start + n
+        buf[start:end] = indata[:n, 0]
+        self._write = end
 
         # Call audio chunk callback for realtime streaming
         if self._on_audio_chunk is not None:
             try:
-                # Pass the chunk (flattened to 1D as expected by STT engines)
-                self._on_audio_chunk(chunk.flatten())
+                # Pass a 1D view of the freshly written region
+                self._on_audio_chunk(buf[start:end])
             except Exception:
                 pass  # Ignore errors in chunk callback
 
@@ -223,7 +302,78 @@ class AudioRecorder:
 # -- module-level helpers -----------------------------------------------------
 
 
-def normalize_audio(audio: np.ndarray, gain: float = 3.0) -> np.ndarray:
+def _gain_clip(audio: np.ndarray, gain: float, out: np.ndarray) -> None:
+    """Fused gain + clip + NaN scrub over 1-D float32 audio (numba kernel source)."""
+    for i in range(audio.shape[0]):
+        v = audio[i] * gain
+        if v > 1.0:
+            v = 1.0
+        elif v < -1.0:
+            v = -1.0
+        elif v != v:  # NaN
+            v = 0.0
+        out[i] = v
+
+
+# Compiled _gain_clip: None = not resolved yet, False = numba unavailable
+# or unusable (the NumPy path is used instead).
+_gain_clip_kernel: Callable[[np.ndarray, float, np.ndarray], None] | bool | None = None
+# Serializes resolution, so startup warm-up and a first recording don't
+# both compile the kernel.
+_gain_clip_lock = threading.Lock()
+
+
+def _get_gain_clip_kernel() -> Callable[[np.ndarray, float, np.ndarray], None] | None:
+    """Import numba and compile :func:`_gain_clip` on first use."""
+    global _gain_clip_kernel
+
+    if _gain_clip_kernel is None:
+        with _gain_clip_lock:
+            if _gain_clip_kernel is None:
+                _gain_clip_kernel = _compile_gain_clip() or False
+
+    return _gain_clip_kernel or None
+
+
+def _compile_gain_clip() -> Callable[[np.ndarray, float, np.ndarray], None] | None:
+    """Build the numba kernel and run it once; ``None`` if that fails."""
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+
+    try:
+        # fastmath without the nnan/ninf flags, so the NaN check survives.
+        # _gain_clip lives at module level so cache=True keys a stable function.
+        kernel = njit(
+            cache=True, fastmath={"nsz", "arcp", "contract", "reassoc"}, boundscheck=False
+        )(_gain_clip)
+        # Compilation happens on the first call, so try it here: an
+        # unwritable cache (e.g. a frozen build) or a JIT failure must not
+        # break every later transcription.
+        scratch = np.zeros(4, dtype=np.float32)
+        kernel(scratch, np.float32(1.0), scratch)
+    except Exception:
+        logger.warning("numba gain kernel unavailable, using NumPy", exc_info=True)
+        return None
+    return kernel
+
+
+def warm_up_normalize() -> None:
+    """Import numba and compile the gain/clip kernel ahead of the first recording.
+
+    Meant to run in the background at startup, so the first dictation
+    doesn't pay the JIT cost.  A no-op when numba isn't installed.
+    """
+    scratch = np.zeros(16, dtype=np.float32)
+    normalize_audio(scratch, 1.0, out=scratch)
+
+
+def normalize_audio(
+    audio: np.ndarray,
+    gain: float = 3.0,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
     """Apply a gain boost and clip to [-1.0, 1.0].
 
     Whispered speech is typically very quiet.  A simple gain stage before
@@ -235,16 +385,29 @@ def normalize_audio(audio: np.ndarray, gain: float = 3.0) -> np.ndarray:
         Float32 audio samples (any shape).
     gain:
         Multiplicative gain factor.
+    out:
+        Optional float32 destination array with the same shape as *audio*.
+        May be *audio* itself for an in-place transform.  A new array is
+        allocated when omitted.
 
     Returns
     -------
     numpy.ndarray
-        Amplified and clipped audio, same shape and dtype as *audio*.
+        Amplified and clipped float32 audio, same shape as *audio*.
     """
     if not isinstance(audio, np.ndarray):
         raise TypeError("audio must be a numpy array")
-    if audio.dtype != np.float32:
-        audio = audio.astype(np.float32)
-    # Remove NaN/infinite values
-    audio = np.nan_to_num(audio, nan=0.0, posinf=1.0, neginf=-1.0)
-    return np.clip(audio * gain, -1.0, 1.0).astype(audio.dtype)
+    if out is None:
+        out = np.empty(audio.shape, dtype=np.float32)
+    elif out.dtype != np.float32 or out.shape != audio.shape:
+        raise ValueError("out must be a float32 array with the same shape as audio")
+    if audio.ndim == 1 and audio.dtype == np.float32:
+        kernel = _get_gain_clip_kernel()
+        if kernel is not None:
+            kernel(audio, np.float32(gain), out)
+            return out
+    np.multiply(audio, gain, out=out, casting="unsafe")
+    # Clipping maps +/-inf to +/-1.0; NaN survives clip, so zero it afterwards.
+    np.clip(out, -1.0, 1.0, out=out)
+    np.nan_to_num(out, copy=False, nan=0.0)
+    return out
@@ -4,9 +4,8 @@ This module detects which features are available at runtime,
 based on whether optional dependencies were bundled during the build.
 """
 
-try:
-    import faster_whisper
+import importlib.util
 
-    HAS_LOCAL_STT = True
-except ImportError:
-    HAS_LOCAL_STT = False
+# Only look the package up: importing faster-whisper pulls in ctranslate2 and
+# friends, which is slow and is deferred until a local STT engine is created.
+HAS_LOCAL_STT = importlib.util.find_spec("faster_whisper") is not None
@@ -8,18 +8,87 @@ import time
 import pyperclip
 from pynput.keyboard import Controller, Key
 
-from untype.platform import get_modifier_key
+from untype.platform import (
+    get_clipboard_sequence_number,
+    get_clipboard_text,
+    get_modifier_key,
+    release_modifier_keys,
+    send_key_combo,
+    set_clipboard_text,
+)
 
 logger = logging.getLogger(__name__)
 
 _keyboard = Controller()
 
+# Clipboard-change polling interval while waiting for Ctrl+C to land.
+_POLL_INTERVAL = 0.005
+
+# Pause after simulating Ctrl+Z before the caller carries on.
+_UNDO_SETTLE = 0.03
+
+# Errors raised by either the native backend or the pyperclip fallback.
+_CLIPBOARD_ERRORS = (pyperclip.PyperclipException, OSError)
+
+
+def _paste() -> str:
+    """Read clipboard text via the native backend, falling back to pyperclip."""
+    try:
+        return get_clipboard_text()
+    except NotImplementedError:
+        return pyperclip.paste()
+
+
+def _copy(text: str) -> None:
+    """Write clipboard text via the native backend, falling back to pyperclip."""
+    try:
+        set_clipboard_text(text)
+    except NotImplementedError:
+        pyperclip.copy(text)
+
+
+def _clipboard_sequence() -> int | None:
+    """Return the clipboard sequence number, or ``None`` if unsupported."""
+    try:
+        return get_clipboard_sequence_number()
+    except NotImplementedError:
+        return None
+
+
+def _wait_for_clipboard_change(seq: int | None, timeout: float) -> bool:
+    """Wait until the clipboard changes from sequence *seq*, at most *timeout* s.
+
+    Returns ``True`` as soon as a change is observed.  Without sequence
+    number support (*seq* is ``None``), sleeps the full *timeout* and
+    returns ``False``.
+    """
+    if seq is None:
+        time.sleep(timeout)
+        return False
+    deadline = time.monotonic() + timeout
+    while True:
+        if _clipboard_sequence() != seq:
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(_POLL_INTERVAL)
+
+
+def copy_text(text: str) -> bool:
+    """Put *text* on the clipboard; log and return ``False`` on failure."""
+    try:
+        _copy(text)
+    except _CLIPBOARD_ERRORS as e:
+        logger.warning("Failed to copy text to clipboard: %s", e)
+        return False
+    return True
+
 
 def save_clipboard() -> str | None:
     """Save and return current clipboard text content."""
     try:
-        return pyperclip.paste()
-    except pyperclip.PyperclipException:
+        return _paste()
+    except _CLIPBOARD_ERRORS:
         return None
 
 
@@ -28,10 +97,10 @@ def restore_clipboard(content: str | None) -> None:
     time.sleep(0.05)
     try:
         if content is None:
-            pyperclip.copy("")
+            _copy("")
         else:
-            pyperclip.copy(content)
-    except pyperclip.PyperclipException:
+            _copy(content)
+    except _CLIPBOARD_ERRORS:
         pass
 
 
@@ -46,19 +115,28 @@ def grab_selected_text() -> tuple[str | None, str | None]:
 
     # Clear the clipboard so we can detect whether Ctrl+C wrote anything new.
     try:
-        pyperclip.copy("")
-    except pyperclip.PyperclipException:
+        _copy("")
+    except _CLIPBOARD_ERRORS:
         return None, original
 
-    # Simulate Ctrl+C to copy the current selection.
+    # Simulate Ctrl+C to copy the current selection, then wait for the
+    # clipboard to change (returns early) or give up after 150 ms.
+    seq = _clipboard_sequence()
     _simulate_hotkey(get_modifier_key(), "c")
-    time.sleep(0.15)
+    deadline = time.monotonic() + 0.15
+    _wait_for_clipboard_change(seq, 0.15)
 
-    # Read whatever ended up on the clipboard.
-    try:
-        text = pyperclip.paste()
-    except pyperclip.PyperclipException:
-        return None, original
+    # The first change may only be the target app's EmptyClipboard, with
+    # the text still being written: keep reading until text shows up or
+    # the 150 ms are spent.
+    while True:
+        try:
+            text = _paste()
+        except _CLIPBOARD_ERRORS:
+            text = None
+        if text or time.monotonic() >= deadline:
+            break
+        time.sleep(_POLL_INTERVAL)
 
     if text:
         return text, original
@@ -79,14 +157,16 @@ def inject_text(text: str, original_clipboard: str | None) -> bool:
     injection_succeeded = False
 
     try:
-        pyperclip.copy(text)
+        _copy(text)
         injection_succeeded = True
-    except pyperclip.PyperclipException as e:
+    except _CLIPBOARD_ERRORS as e:
         logger.warning("Failed to copy text to clipboard: %s", e)
 
     if injection_succeeded:
         try:
-            time.sleep(0.05)
+            # _copy() is synchronous, so the text is already on the clipboard.
+            # The post-paste delay stays fixed: the target app reads the
+            # clipboard asynchronously and reads don't bump the sequence.
             _simulate_hotkey(get_modifier_key(), "v")
             time.sleep(0.1)
         except Exception as e:
@@ -108,6 +188,17 @@ def _simulate_hotkey(key: Key, char: str) -> None:
     # Release any modifiers the user might still be holding from the hotkey
     _release_all_modifiers()
     time.sleep(0.05)
+    try:
+        # Native backends inject the whole combo at once, no sleeps needed.
+        send_key_combo(key, char)
+        return
+    except NotImplementedError:
+        pass
+    except OSError as e:
+        # Injection was blocked (e.g. elevated target window); pynput would
+        # hit the same wall, so don't retry.
+        logger.warning("Failed to send %s+%s: %s", key, char, e)
+        return
     _keyboard.press(key)
     time.sleep(0.05)
     _keyboard.press(char)
@@ -119,6 +210,14 @@ def _simulate_hotkey(key: Key, char: str) -> None:
 
 def _release_all_modifiers() -> None:
     """Send key-up events for all common modifier keys."""
+    try:
+        release_modifier_keys()
+        return
+    except NotImplementedError:
+        pass
+    except OSError as e:
+        logger.debug("Failed to release modifiers: %s", e)
+        return
     for mod in (
         Key.alt_l,
         Key.alt_r,
@@ -137,3 +236,15 @@ def _release_all_modifiers() -> None:
 
 # Public alias for use by other modules (e.g. ghost menu revert/regenerate).
 release_all_modifiers = _release_all_modifiers
+
+
+def simulate_undo() -> None:
+    """Send Ctrl+Z to undo the last paste in the foreground app.
+
+    Uses the same path as the Ctrl+C / Ctrl+V simulation, so native
+    backends inject the whole combo in one call.
+    """
+    _simulate_hotkey(Key.ctrl_l, "z")
+    # Input events are queued in order, so this only lets the target
+    # process the undo before the caller reads or repaints anything.
+    time.sleep(_UNDO_SETTLE)
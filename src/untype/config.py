@@ -2,29 +2,66 @@
 
 from __future__ import annotations
 
-import json
+import functools
 import logging
-import tomllib
-from dataclasses import asdict, dataclass, field, fields
+import os
+from dataclasses import MISSING, asdict, dataclass, field, fields, is_dataclass
 from pathlib import Path
 from urllib.parse import urlparse
 
-import tomli_w
-
 logger = logging.getLogger(__name__)
 
+# Prefer the native rtoml parser/serializer when installed; tomllib/tomli_w
+# produce the same dicts and stay as the fallback.
+try:
+    import rtoml
+
+    _toml_loads = rtoml.loads
+    _toml_dumps = rtoml.dumps
+    _TOMLDecodeError = rtoml.TomlParsingError
+except ImportError:
+    import tomllib
+
+    _toml_loads = tomllib.loads
+    _TOMLDecodeError = tomllib.TOMLDecodeError
+
+    def _toml_dumps(data: dict) -> str:
+        import tomli_w
+
+        return tomli_w.dumps(data)
+
+
+# orjson reads and writes persona files faster when installed; the stdlib
+# json module is only imported when it isn't.  Both dump to UTF-8 bytes.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+
+    def _json_dumps(data: dict) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+
+    _json_loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
+    def _json_dumps(data: dict) -> bytes:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
 # ---------------------------------------------------------------------------
 # Config schema
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class HotkeyConfig:
     trigger: str = "f6"
     mode: str = "toggle"  # "toggle" (press to start/stop) or "hold" (push-to-talk)
 
 
-@dataclass
+@dataclass(slots=True)
 class OverlayConfig:
     # Capsule position mode: "caret" (follow cursor) or "fixed" (draggable)
     capsule_position_mode: str = "fixed"
@@ -34,14 +71,14 @@ class OverlayConfig:
     capsule_fixed_y: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioConfig:
     sample_rate: int = 16000
     gain_boost: float = 1.5
     device: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class STTConfig:
     # Backend: "local", "api", or "realtime_api" (Aliyun WebSocket)
     backend: str = "realtime_api"
@@ -64,7 +101,7 @@ class STTConfig:
     realtime_api_sample_rate: int = 16000  # Must match audio config
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMPrompts:
     polish: str = (
         "You are a text editing tool embedded in a voice-input pipeline. "
@@ -101,7 +138,7 @@ class LLMPrompts:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMConfig:
     base_url: str = ""
     api_key: str = ""
@@ -111,7 +148,7 @@ class LLMConfig:
     prompts: LLMPrompts = field(default_factory=LLMPrompts)
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     hotkey: HotkeyConfig = field(default_factory=HotkeyConfig)
     overlay: OverlayConfig = field(default_factory=OverlayConfig)
@@ -127,7 +164,7 @@ class AppConfig:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class Persona:
     id: str
     name: str
@@ -169,30 +206,35 @@ def _clamp_int(value: int, min_val: int, max_val: int) -> int:
     return max(min_val, min(max_val, value))
 
 
+@functools.cache
 def get_config_path() -> Path:
-    """Return the path to the config file (~/.untype/config.toml)."""
+    """Return the path to the config file (~/.untype/config.toml).
+
+    Memoized: the home directory does not change while the app runs.
+    """
     return Path.home() / ".untype" / "config.toml"
 
 
+@functools.cache
+def _field_names(cls: type) -> frozenset[str]:
+    """Return the field names of dataclass *cls* (computed once per class)."""
+    return frozenset(f.name for f in fields(cls))
+
+
 def _merge_into_dataclass(cls: type, data: dict) -> object:
     """Create a dataclass instance from *data*, ignoring unknown keys."""
-    known = {f.name for f in fields(cls)}
+    known = _field_names(cls)
     return cls(**{k: v for k, v in data.items() if k in known})
 
 
-def _deep_merge(defaults: dict, overrides: dict) -> dict:
-    """Recursively merge *overrides* into *defaults* (non-destructive)."""
-    merged = defaults.copy()
-    for key, value in overrides.items():
-        if key in merged and isinstance(merged[key], dict) and isinstance(value, dict):
-            merged[key] = _deep_merge(merged[key], value)
-        else:
-            merged[key] = value
-    return merged
-
-
 def _dict_to_config(data: dict) -> AppConfig:
-    """Build an AppConfig from a plain dict (e.g. parsed TOML)."""
+    """Build an AppConfig from a plain dict (e.g. parsed TOML).
+
+    Missing sections and keys fall back to the dataclass defaults.  This is
+    the only place untrusted values are validated and clamped; the config
+    dataclasses themselves stay validation-free so that default
+    construction and copies pay nothing.
+    """
     hotkey = _merge_into_dataclass(HotkeyConfig, data.get("hotkey", {}))
     overlay = _merge_into_dataclass(OverlayConfig, data.get("overlay", {}))
     audio = _merge_into_dataclass(AudioConfig, data.get("audio", {}))
@@ -251,55 +293,131 @@ def _dict_to_config(data: dict) -> AppConfig:
         )
         audio.sample_rate = _clamp_int(audio.sample_rate, 8000, 48000)
 
-    return AppConfig(hotkey=hotkey, overlay=overlay, audio=audio, stt=stt, llm=llm)
+    # Top-level scalar settings; absent keys keep the AppConfig defaults.
+    scalars = {k: data[k] for k in ("language", "last_selected_persona") if k in data}
 
+    return AppConfig(hotkey=hotkey, overlay=overlay, audio=audio, stt=stt, llm=llm, **scalars)
+
+
+# A dump plan is a tuple of (field_name, sub_plan) pairs; sub_plan is None
+# for scalar fields and a nested plan for dataclass-valued fields.
+_DumpPlan = tuple[tuple[str, "_DumpPlan | None"], ...]
+
+
+def _build_dump_plan(cls: type) -> _DumpPlan:
+    """Precompute the field layout of config dataclass *cls* for dumping.
+
+    Nested sections are recognised by their ``default_factory`` being a
+    dataclass (annotations are strings under ``from __future__ import
+    annotations``).
+    """
+    plan = []
+    for f in fields(cls):
+        factory = f.default_factory
+        if factory is not MISSING and is_dataclass(factory):
+            plan.append((f.name, _build_dump_plan(factory)))
+        else:
+            plan.append((f.name, None))
+    return tuple(plan)
+
+
+def _dump_with_plan(obj: object, plan: _DumpPlan) -> dict:
+    """Dump *obj* to a dict following *plan*, dropping ``None`` values."""
+    data = {}
+    for name, sub_plan in plan:
+        value = getattr(obj, name)
+        if value is None:
+            continue
+        data[name] = value if sub_plan is None else _dump_with_plan(value, sub_plan)
+    return data
+
+
+_APP_CONFIG_PLAN = _build_dump_plan(AppConfig)
 
-def _config_to_dict(config: AppConfig) -> dict:
-    """Convert an AppConfig to a plain dict suitable for TOML serialization.
 
-    Filters out None values since TOML doesn't support null.
+def _copy_with_plan(obj: object, plan: _DumpPlan) -> object:
+    """Copy config dataclass *obj* following *plan*.
+
+    Leaf values are immutable (str/int/float/bool/None), so only the
+    dataclass instances themselves need duplicating.
     """
-    data = asdict(config)
+    return type(obj)(
+        **{
+            name: getattr(obj, name)
+            if sub_plan is None
+            else _copy_with_plan(getattr(obj, name), sub_plan)
+            for name, sub_plan in plan
+        }
+    )
+
+
+def copy_config(config: AppConfig) -> AppConfig:
+    """Return an independent copy of *config*.
+
+    Equivalent to ``copy.deepcopy(config)`` but walks the precomputed field
+    plan instead of the generic deepcopy/reduce machinery.
+    """
+    return _copy_with_plan(config, _APP_CONFIG_PLAN)
+
 
-    # Recursively remove None values
-    def _remove_none(obj: object) -> object:
-        if isinstance(obj, dict):
-            return {k: _remove_none(v) for k, v in obj.items() if v is not None}
-        return obj
+def _config_to_dict(config: AppConfig) -> dict:
+    """Convert an AppConfig to a plain dict suitable for TOML serialization.
 
-    return _remove_none(data)  # type: ignore[return-value]
+    Filters out None values since TOML doesn't support null.  Uses a field
+    plan computed once at import instead of ``asdict()`` reflection.
+    """
+    return _dump_with_plan(config, _APP_CONFIG_PLAN)
 
 
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
+# Last parsed config, keyed by the file's mtime (ns).  Callers mutate the
+# config they get back, so only deep copies of the cached instance leave here.
+_config_cache: tuple[int, AppConfig] | None = None
+
+
+def invalidate_config_cache() -> None:
+    """Drop the cached config so the next :func:`load_config` re-reads the file."""
+    global _config_cache
+    _config_cache = None
+
 
 def load_config() -> AppConfig:
     """Load config from file, merge with defaults.
 
     Creates a default config file if one does not exist.
-    Handles corrupted TOML files gracefully.
+    Handles corrupted TOML files gracefully.  The parsed result is cached
+    and reused until the file's modification time changes.
     """
+    global _config_cache
+
     path = get_config_path()
 
-    if not path.exists():
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
         config = AppConfig()
         save_config(config)
         return config
 
+    cached = _config_cache
+    if cached is not None and cached[0] == mtime:
+        return copy_config(cached[1])
+
     try:
-        with open(path, "rb") as f:
-            file_data = tomllib.load(f)
-    except (tomllib.TOMLDecodeError, OSError) as e:
+        # Config files are tiny: one read + loads() beats streaming via load().
+        file_data = _toml_loads(path.read_text(encoding="utf-8"))
+    except (_TOMLDecodeError, UnicodeDecodeError, OSError) as e:
         logger.error("Failed to load config from %s: %s. Using defaults.", path, e)
         config = AppConfig()
         save_config(config)
         return config
 
-    default_data = _config_to_dict(AppConfig())
-    merged = _deep_merge(default_data, file_data)
-    return _dict_to_config(merged)
+    config = _dict_to_config(file_data)
+    _config_cache = (mtime, copy_config(config))
+    return config
 
 
 def save_config(config: AppConfig) -> None:
@@ -311,8 +429,11 @@ def save_config(config: AppConfig) -> None:
         OSError: If the config file cannot be written. The backup file
             is preserved for recovery.
     """
+    global _config_cache
+
     path = get_config_path()
     path.parent.mkdir(parents=True, exist_ok=True)
+    invalidate_config_cache()
 
     # Create backup if config file exists
     backup_path = path.with_suffix(".toml.bak")
@@ -325,14 +446,18 @@ def save_config(config: AppConfig) -> None:
     try:
         # Write to a temporary file first, then atomic rename
         temp_path = path.with_suffix(".toml.tmp")
-        with open(temp_path, "wb") as f:
-            tomli_w.dump(data, f)
+        temp_path.write_bytes(_toml_dumps(data).encode("utf-8"))
 
         # Atomic replace on Windows
         if path.exists():
             path.unlink()
         temp_path.replace(path)
 
+        # Seed the cache from what was just written, so the next load_config()
+        # is a stat() instead of a re-parse.  Built from *data* rather than
+        # *config* to match exactly what reading the file back would produce.
+        _config_cache = (path.stat().st_mtime_ns, _dict_to_config(data))
+
     except Exception:
         # Restore from backup if save failed
         if backup_path.exists():
@@ -347,6 +472,7 @@ def save_config(config: AppConfig) -> None:
 # ---------------------------------------------------------------------------
 
 
+@functools.cache
 def get_personas_dir() -> Path:
     """Return the path to the personas directory.
 
@@ -354,6 +480,8 @@ def get_personas_dir() -> Path:
     When frozen (PyInstaller): check two locations:
         1. Next to the .exe (user-customizable, takes priority)
         2. Inside _internal/ (bundled defaults)
+
+    The result is cached for the lifetime of the process.
     """
     import sys
 
@@ -382,14 +510,21 @@ def load_personas() -> list[Persona]:
     if not personas_dir.is_dir():
         return []
 
-    known = {f.name for f in fields(Persona)}
+    known = _field_names(Persona)
     personas: list[Persona] = []
 
-    for path in sorted(personas_dir.glob("*.json")):
+    # One scandir() pass yields names and file types without a stat per path.
+    with os.scandir(personas_dir) as it:
+        entries = sorted(
+            (e for e in it if e.name.endswith(".json") and e.is_file()),
+            key=lambda e: e.name,
+        )
+
+    for entry in entries:
+        path = Path(entry.path)
         try:
-            with open(path, encoding="utf-8") as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, OSError) as exc:
+            data = _json_loads(path.read_bytes())
+        except (_JSONDecodeError, UnicodeDecodeError, OSError) as exc:
             logger.warning("Failed to load persona from %s: %s", path, exc)
             continue
 
@@ -422,9 +557,7 @@ def save_persona(persona: Persona) -> None:
     personas_dir.mkdir(parents=True, exist_ok=True)
 
     path = personas_dir / f"{persona.id}.json"
-    data = asdict(persona)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    path.write_bytes(_json_dumps(asdict(persona)))
 
 
 def delete_persona(persona_id: str) -> bool:
@@ -1,7 +1,6 @@
 """Global hotkey listener using pynput with push-to-talk semantics."""
 
 import logging
-import threading
 from typing import Callable
 
 from pynput import keyboard
@@ -17,13 +16,14 @@ _MODIFIER_MAP: dict[str, set[keyboard.Key]] = {
     "win": {keyboard.Key.cmd, keyboard.Key.cmd_l, keyboard.Key.cmd_r},
 }
 
-# Reverse lookup: any pynput Key variant -> canonical modifier name
-_KEY_TO_MODIFIER: dict[keyboard.Key, str] = {}
-for _name, _variants in _MODIFIER_MAP.items():
-    if _name == "win":
-        continue  # "win" is an alias for "cmd", skip to avoid overwrite
-    for _key in _variants:
-        _KEY_TO_MODIFIER[_key] = _name
+# Reverse lookup: any pynput Key variant -> canonical modifier name.
+# "win" is an alias for "cmd", skipped to avoid overwriting it.
+_KEY_TO_MODIFIER: dict[keyboard.Key, str] = {
+    key: name for name, variants in _MODIFIER_MAP.items() if name != "win" for key in variants
+}
+
+# Bit assigned to each canonical modifier, so held/required sets are ints
+_MOD_BITS: dict[str, int] = {"alt": 1, "ctrl": 2, "shift": 4, "cmd": 8}
 
 # Named special keys that aren't modifiers
 _SPECIAL_KEYS: dict[str, keyboard.Key] = {
@@ -58,7 +58,7 @@ _SPECIAL_KEYS: dict[str, keyboard.Key] = {
 }
 
 
-def parse_hotkey(hotkey_str: str) -> tuple[set[str], keyboard.KeyCode | keyboard.Key]:
+def parse_hotkey(hotkey_str: str) -> tuple[frozenset[str], keyboard.KeyCode | keyboard.Key]:
     """Parse a hotkey string like "alt+space" into (modifier_names, trigger_key).
 
     The last component is always the trigger key. All preceding components
@@ -68,44 +68,42 @@ def parse_hotkey(hotkey_str: str) -> tuple[set[str], keyboard.KeyCode | keyboard
         hotkey_str: Combo string such as "alt+space" or "ctrl+shift+a".
 
     Returns:
-        A tuple of (set of canonical modifier names, trigger key).
+        A tuple of (frozenset of canonical modifier names, trigger key).
 
     Raises:
         ValueError: If the string is empty, has an unknown modifier, or has
             no trigger key.
     """
-    parts = [p.strip().lower() for p in hotkey_str.split("+")]
-    if not parts or parts == [""]:
+    # Spaces are never meaningful in a combo; drop them all in one C-level pass.
+    mods_str, sep, trigger_part = hotkey_str.lower().replace(" ", "").rpartition("+")
+    if not sep and not trigger_part:
         raise ValueError(f"Empty hotkey string: {hotkey_str!r}")
 
-    *modifier_parts, trigger_part = parts
-
     # Validate modifiers
     modifiers: set[str] = set()
-    for mod in modifier_parts:
-        canonical = "cmd" if mod == "win" else mod
-        if canonical not in _MODIFIER_MAP:
-            raise ValueError(
-                f"Unknown modifier {mod!r} in hotkey {hotkey_str!r}. "
-                f"Supported modifiers: alt, ctrl, shift, cmd/win"
-            )
-        modifiers.add(canonical)
+    if sep:
+        for mod in mods_str.split("+"):
+            canonical = "cmd" if mod == "win" else mod
+            if canonical not in _MODIFIER_MAP:
+                raise ValueError(
+                    f"Unknown modifier {mod!r} in hotkey {hotkey_str!r}. "
+                    f"Supported modifiers: alt, ctrl, shift, cmd/win"
+                )
+            modifiers.add(canonical)
 
     # Resolve trigger key
-    trigger: keyboard.KeyCode | keyboard.Key
-    if trigger_part in _SPECIAL_KEYS:
-        trigger = _SPECIAL_KEYS[trigger_part]
-    elif trigger_part in _MODIFIER_MAP or trigger_part == "win":
-        raise ValueError(
-            f"Trigger key {trigger_part!r} is a modifier. "
-            f"The last component of {hotkey_str!r} must be a non-modifier key."
-        )
-    elif len(trigger_part) == 1:
+    trigger: keyboard.KeyCode | keyboard.Key | None = _SPECIAL_KEYS.get(trigger_part)
+    if trigger is None:
+        if trigger_part in _MODIFIER_MAP or trigger_part == "win":
+            raise ValueError(
+                f"Trigger key {trigger_part!r} is a modifier. "
+                f"The last component of {hotkey_str!r} must be a non-modifier key."
+            )
+        if len(trigger_part) != 1:
+            raise ValueError(f"Unknown trigger key {trigger_part!r} in hotkey {hotkey_str!r}")
         trigger = keyboard.KeyCode.from_char(trigger_part)
-    else:
-        raise ValueError(f"Unknown trigger key {trigger_part!r} in hotkey {hotkey_str!r}")
 
-    return modifiers, trigger
+    return frozenset(modifiers), trigger
 
 
 class HotkeyListener:
@@ -129,22 +127,34 @@ class HotkeyListener:
         on_escape: Callable[[], None] | None = None,
     ) -> None:
         self._modifiers, self._trigger = parse_hotkey(hotkey_str)
+        self._modifiers_mask = sum(_MOD_BITS[m] for m in self._modifiers)
+        # Trigger matcher specialised once for the trigger's type, so key
+        # events never re-inspect the configured trigger.
+        self._trigger_char_lower: str | None = None
+        self._is_trigger: Callable[[keyboard.Key | keyboard.KeyCode], bool]
+        if isinstance(self._trigger, keyboard.Key):
+            self._is_trigger = self._is_special_trigger
+        else:
+            self._trigger_char_lower = (self._trigger.char or "").lower() or None
+            self._is_trigger = self._is_char_trigger
         self._on_press = on_press
         self._on_release = on_release
         self._on_escape = on_escape
         self._hotkey_str = hotkey_str
         self._mode = mode  # "hold" or "toggle"
 
-        # Currently held modifier names (canonical)
-        self._held_modifiers: set[str] = set()
+        # Currently held modifiers, as a bitmask of _MOD_BITS
+        self._held_modifiers: int = 0
         # Whether the trigger key is currently held
         self._trigger_held: bool = False
         # Whether the hotkey is currently active (pressed and not yet released)
         self._active: bool = False
         # Toggle mode: whether recording is currently in progress
         self._toggled_on: bool = False
+        # No lock: the key state above is only updated from the single pynput
+        # listener thread.  reset_toggle()/stop() merely store plain bools,
+        # which is atomic under the GIL, so key events never block on them.
 
-        self._lock = threading.Lock()
         self._listener: keyboard.Listener | None = None
 
         logger.debug("HotkeyListener configured for %r (mode=%s)", hotkey_str, mode)
@@ -178,11 +188,10 @@ class HotkeyListener:
                 thread.join(timeout=1.0)
             self._listener = None
             logger.info("Hotkey listener stopped")
-        with self._lock:
-            self._held_modifiers.clear()
-            self._trigger_held = False
-            self._active = False
-            self._toggled_on = False
+        self._held_modifiers = 0
+        self._trigger_held = False
+        self._active = False
+        self._toggled_on = False
 
     def reset_toggle(self) -> None:
         """Reset the toggle state so the next press is treated as a new start.
@@ -191,9 +200,8 @@ class HotkeyListener:
         emergency stop button) so that the HotkeyListener doesn't think
         it's still in the "toggled on" state.
         """
-        with self._lock:
-            self._toggled_on = False
-            self._active = False
+        self._toggled_on = False
+        self._active = False
 
     # ------------------------------------------------------------------
     # Internal key handlers
@@ -201,18 +209,19 @@ class HotkeyListener:
 
     def _normalize_modifier(self, key: keyboard.Key | keyboard.KeyCode) -> str | None:
         """Return the canonical modifier name if *key* is a modifier, else None."""
-        if isinstance(key, keyboard.Key):
-            return _KEY_TO_MODIFIER.get(key)
-        return None
+        # KeyCodes hash fine and are never in the table, so no type check needed.
+        return _KEY_TO_MODIFIER.get(key)
 
-    def _is_trigger(self, key: keyboard.Key | keyboard.KeyCode) -> bool:
-        """Return True if *key* matches the configured trigger key."""
-        if isinstance(self._trigger, keyboard.Key):
-            return key == self._trigger
+    def _is_special_trigger(self, key: keyboard.Key | keyboard.KeyCode) -> bool:
+        """Return True if *key* is the configured special (``Key``) trigger."""
+        return key is self._trigger or key == self._trigger
+
+    def _is_char_trigger(self, key: keyboard.Key | keyboard.KeyCode) -> bool:
+        """Return True if *key* matches the configured character trigger."""
         # KeyCode comparison — match by char (case-insensitive)
-        if isinstance(key, keyboard.KeyCode) and isinstance(self._trigger, keyboard.KeyCode):
-            if key.char is not None and self._trigger.char is not None:
-                return key.char.lower() == self._trigger.char.lower()
+        if self._trigger_char_lower is not None and isinstance(key, keyboard.KeyCode):
+            if key.char is not None:
+                return key.char.lower() == self._trigger_char_lower
         return False
 
     def _on_key_press(self, key: keyboard.Key | keyboard.KeyCode) -> None:
@@ -220,43 +229,43 @@ class HotkeyListener:
         fire_release = False
         fire_escape = False
 
-        with self._lock:
-            # Check for Escape key first (can cancel at any time).
-            if isinstance(key, keyboard.Key) and key == keyboard.Key.esc:
-                if self._on_escape is not None:
-                    fire_escape = True
-                # Don't process Escape further
-                fire_press = False
-                fire_release = False
-            else:
-                mod = self._normalize_modifier(key)
-                if mod is not None:
-                    self._held_modifiers.add(mod)
-
-                if self._is_trigger(key):
-                    self._trigger_held = True
-
-                # Check if the full hotkey combo is pressed.
-                combo_pressed = self._trigger_held and self._modifiers <= self._held_modifiers
-
-                if self._mode == "toggle":
-                    # Toggle mode: first press → on_press, second press → on_release.
-                    # We only act on the initial combo press (not auto-repeat).
-                    if combo_pressed and not self._active:
-                        self._active = True  # track physical key state
-                        if not self._toggled_on:
-                            self._toggled_on = True
-                            fire_press = True
-                        else:
-                            self._toggled_on = False
-                            fire_release = True
-                else:
-                    # Hold mode: press → on_press (release handled in _on_key_release).
-                    if combo_pressed and not self._active:
-                        self._active = True
+        # Check for Escape key first (can cancel at any time).
+        if isinstance(key, keyboard.Key) and key == keyboard.Key.esc:
+            if self._on_escape is not None:
+                fire_escape = True
+            # Don't process Escape further
+            fire_press = False
+            fire_release = False
+        else:
+            mod = self._normalize_modifier(key)
+            if mod is not None:
+                self._held_modifiers |= _MOD_BITS[mod]
+
+            if self._is_trigger(key):
+                self._trigger_held = True
+
+            # Check if the full hotkey combo is pressed.
+            mask = self._modifiers_mask
+            combo_pressed = self._trigger_held and (self._held_modifiers & mask) == mask
+
+            if self._mode == "toggle":
+                # Toggle mode: first press → on_press, second press → on_release.
+                # We only act on the initial combo press (not auto-repeat).
+                if combo_pressed and not self._active:
+                    self._active = True  # track physical key state
+                    if not self._toggled_on:
+                        self._toggled_on = True
                         fire_press = True
+                    else:
+                        self._toggled_on = False
+                        fire_release = True
+            else:
+                # Hold mode: press → on_press (release handled in _on_key_release).
+                if combo_pressed and not self._active:
+                    self._active = True
+                    fire_press = True
 
-        # Fire callbacks outside the lock to avoid deadlocks.
+        # Fire callbacks after the state update is complete.
         if fire_escape:
             logger.debug("Escape pressed - cancelling")
             try:
@@ -281,34 +290,33 @@ class HotkeyListener:
     def _on_key_release(self, key: keyboard.Key | keyboard.KeyCode) -> None:
         fire_release = False
 
-        with self._lock:
-            if self._mode == "toggle":
-                # Toggle mode: key release never fires on_release — only
-                # reset the physical key tracking so the next press is detected.
+        if self._mode == "toggle":
+            # Toggle mode: key release never fires on_release — only
+            # reset the physical key tracking so the next press is detected.
+            mod = self._normalize_modifier(key)
+            if self._is_trigger(key):
+                self._active = False
+                self._trigger_held = False
+            if mod is not None:
+                self._held_modifiers &= ~_MOD_BITS[mod]
+        else:
+            # Hold mode: release fires on_release if active.
+            if self._active:
                 mod = self._normalize_modifier(key)
-                if self._is_trigger(key):
+                if self._is_trigger(key) or (mod is not None and mod in self._modifiers):
+                    fire_release = True
                     self._active = False
-                    self._trigger_held = False
-                if mod is not None:
-                    self._held_modifiers.discard(mod)
-            else:
-                # Hold mode: release fires on_release if active.
-                if self._active:
-                    mod = self._normalize_modifier(key)
-                    if self._is_trigger(key) or (mod is not None and mod in self._modifiers):
-                        fire_release = True
-                        self._active = False
-                        logger.debug("Hotkey deactivated: %s", self._hotkey_str)
+                    logger.debug("Hotkey deactivated: %s", self._hotkey_str)
 
-                # Update tracking state *after* deactivation check.
-                mod = self._normalize_modifier(key)
-                if mod is not None:
-                    self._held_modifiers.discard(mod)
+            # Update tracking state *after* deactivation check.
+            mod = self._normalize_modifier(key)
+            if mod is not None:
+                self._held_modifiers &= ~_MOD_BITS[mod]
 
-                if self._is_trigger(key):
-                    self._trigger_held = False
+            if self._is_trigger(key):
+                self._trigger_held = False
 
-        # Fire callback outside the lock to avoid deadlocks.
+        # Fire callback after the state update is complete.
         if fire_release:
             try:
                 self._on_release()
@@ -6,13 +6,27 @@ Users can add their own translations by placing ``<lang>.json`` files there.
 
 from __future__ import annotations
 
-import json
+import functools
 import logging
+import os
 from pathlib import Path
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# orjson parses locale files faster when installed; the stdlib json module is
+# only imported when it isn't.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    import json
+
+    _json_loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
 # Built-in fallback translations (used when no locale files exist)
 _FALLBACK: dict[str, str] = {
     "app.name": "UnType",
@@ -32,7 +46,14 @@ _translations: dict[str, str] = {}
 # Current language code
 _current_lang: str = "zh"
 
+# Parsed locale files by language code (None = missing or unreadable)
+_locale_cache: dict[str, dict[str, Any] | None] = {}
 
+# Locale codes found in the locales directory (None = not scanned yet)
+_available_locales: list[str] | None = None
+
+
+@functools.cache
 def get_locales_dir() -> Path:
     """Return the path to the locales directory.
 
@@ -40,6 +61,8 @@ def get_locales_dir() -> Path:
     When frozen (PyInstaller): check two locations:
         1. Next to the .exe (user-customizable, takes priority)
         2. Inside _internal/ (bundled defaults)
+
+    The result is cached for the lifetime of the process.
     """
     import sys
 
@@ -59,12 +82,28 @@ def list_available_locales() -> list[str]:
     """Return a list of available locale codes (e.g. ``['en', 'zh']``).
 
     Each locale corresponds to a ``<code>.json`` file in the locales directory.
-    Returns an empty list if the directory does not exist.
+    Returns an empty list if the directory does not exist.  The directory is
+    scanned once; call :func:`refresh_locales` to pick up new files.
     """
-    locales_dir = get_locales_dir()
-    if not locales_dir.is_dir():
-        return []
-    return sorted(p.stem for p in locales_dir.glob("*.json"))
+    global _available_locales
+
+    if _available_locales is None:
+        try:
+            with os.scandir(get_locales_dir()) as it:
+                _available_locales = sorted(
+                    e.name[:-5] for e in it if e.name.endswith(".json") and e.is_file()
+                )
+        except OSError:
+            _available_locales = []
+    return list(_available_locales)
+
+
+def refresh_locales() -> None:
+    """Forget the scanned locale list and parsed locale files."""
+    global _available_locales
+
+    _available_locales = None
+    _locale_cache.clear()
 
 
 def get_locale_display_name(lang: str) -> str:
@@ -82,16 +121,21 @@ def load_locale(lang: str) -> dict[str, Any] | None:
     """Load a locale JSON file.
 
     Returns ``None`` if the file does not exist or cannot be parsed.
+    Results are cached per language, so each file is read at most once.
     """
+    if lang in _locale_cache:
+        return _locale_cache[lang]
+
     path = get_locales_dir() / f"{lang}.json"
-    if not path.exists():
-        return None
+    data: dict[str, Any] | None = None
     try:
-        with open(path, encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError) as exc:
+        data = _json_loads(path.read_bytes())
+    except FileNotFoundError:
+        pass
+    except (_JSONDecodeError, UnicodeDecodeError, OSError) as exc:
         logger.warning("Failed to load locale %s: %s", lang, exc)
-        return None
+    _locale_cache[lang] = data
+    return data
 
 
 def set_language(lang: str) -> bool:
@@ -1,13 +1,62 @@
 """OpenAI-compatible LLM client for text polishing and voice-to-text insertion."""
 
 import concurrent.futures
+import functools
+import hashlib
+import importlib.util
+import json
 import logging
 import threading
+from collections import OrderedDict
+from typing import Callable
+from urllib.parse import urlparse
 
 import httpx
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of deterministic (temperature 0) responses kept in memory.
+_RESPONSE_CACHE_SIZE = 256
+
+# Hosts known to accept the ``prompt_cache_key`` request field.  Other
+# OpenAI-compatible providers may reject unknown fields, so it is opt-in.
+_PROMPT_CACHE_KEY_HOSTS = frozenset({"api.openai.com"})
+
+
+@functools.lru_cache(maxsize=64)
+def _prompt_cache_key(system: str) -> str:
+    """Return a short stable key identifying a system prompt."""
+    return hashlib.blake2b(system.encode("utf-8"), digest_size=8).hexdigest()
+
+
+class _InFlight:
+    """Book-keeping for one cancellable request."""
+
+    __slots__ = ("wake", "response")
+
+    def __init__(self) -> None:
+        # Set when the request finishes or abort() is called.
+        self.wake = threading.Event()
+        # The open streaming response, so abort() can cut it off.
+        self.response: httpx.Response | None = None
+
+
+# HTTP/2 needs the optional ``h2`` package (``pip install httpx[http2]``).
+_HAS_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Prefer orjson for request/response (de)serialization when installed.
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+
+    def _json_dumps(obj: object) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    _json_loads = json.loads
+
 _DEFAULT_PROMPTS = {
     "polish": (
         "You are a text editing tool embedded in a voice-input pipeline. "
@@ -70,9 +119,33 @@ class LLMClient:
         self.model = model
         self.temperature = temperature
         self.max_tokens = max_tokens
-        self.prompts = {**_DEFAULT_PROMPTS, **(prompts or {})}
+        self.prompts = {**_DEFAULT_PROMPTS, **prompts} if prompts else _DEFAULT_PROMPTS.copy()
+        # Instance-default request fields; _chat copies this and fills in the rest.
+        self._payload_base = {
+            "model": model,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+        # LRU of responses to deterministic requests, keyed by
+        # (model, max_tokens, system, user).  In memory only: user text is
+        # never written to disk.
+        self._response_cache: OrderedDict[tuple, str] = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+
+        # Cancellable requests run here.  An aborted request may linger on
+        # its worker until the server responds, so leave room for a new one.
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="untype-llm"
+        )
+        self._inflight: set[_InFlight] = set()
+        self._inflight_lock = threading.Lock()
 
         self._base_url = base_url.rstrip("/")
+        # Providers cache the longest repeated prompt prefix server-side.  The
+        # static system prompt always comes first and all per-call text goes in
+        # the user message; where supported, a key derived from the system
+        # prompt also routes repeats to the same cache.
+        self._send_prompt_cache_key = urlparse(self._base_url).hostname in _PROMPT_CACHE_KEY_HOSTS
         self._client = httpx.Client(
             base_url=self._base_url,
             headers={
@@ -80,9 +153,36 @@ class LLMClient:
                 "Content-Type": "application/json",
             },
             timeout=httpx.Timeout(connect=30.0, read=60.0, write=30.0, pool=30.0),
+            # Keep the TLS connection warm between voice inputs so each call
+            # skips the TCP + TLS handshake.  No custom transport: httpx only
+            # honours HTTP(S)_PROXY / ALL_PROXY when it builds its own.
             verify=True,
+            http2=_HAS_HTTP2,
+            limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=120.0),
         )
 
+    def update_settings(
+        self,
+        *,
+        temperature: float,
+        max_tokens: int,
+        prompts: dict | None = None,
+    ) -> None:
+        """Change sampling defaults and system prompts in place.
+
+        The HTTP connection is left alone, so a warm connection survives
+        settings edits that do not touch the endpoint, key, or model.
+        """
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        self.prompts = {**_DEFAULT_PROMPTS, **prompts} if prompts else _DEFAULT_PROMPTS.copy()
+        # Swapped as a whole so a concurrent _chat sees either old or new values.
+        self._payload_base = {
+            "model": self.model,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+
     # ------------------------------------------------------------------
     # Public helpers
     # ------------------------------------------------------------------
@@ -97,6 +197,8 @@ class LLMClient:
         temperature: float | None = None,
         max_tokens: int | None = None,
         cancel_event: threading.Event | None = None,
+        on_delta: Callable[[str], None] | None = None,
+        use_cache: bool = True,
     ) -> str:
         """Refine *original_text* according to a voice *instruction*.
 
@@ -105,6 +207,10 @@ class LLMClient:
 
         Args:
             cancel_event: If provided, request can be cancelled by setting this event.
+            on_delta: If provided, the response is streamed and this is called
+                with the text accumulated so far each time a chunk arrives.
+            use_cache: If False, always query the LLM (the fresh response
+                still replaces any cached one).
         """
         user_message = (
             f"<original_text>\n{original_text}\n</original_text>\n\n"
@@ -117,6 +223,8 @@ class LLMClient:
             temperature=temperature,
             max_tokens=max_tokens,
             cancel_event=cancel_event,
+            on_delta=on_delta,
+            use_cache=use_cache,
         )
 
     def insert(
@@ -128,6 +236,8 @@ class LLMClient:
         temperature: float | None = None,
         max_tokens: int | None = None,
         cancel_event: threading.Event | None = None,
+        on_delta: Callable[[str], None] | None = None,
+        use_cache: bool = True,
     ) -> str:
         """Convert raw *spoken_text* into well-formed written text.
 
@@ -136,6 +246,10 @@ class LLMClient:
 
         Args:
             cancel_event: If provided, request can be cancelled by setting this event.
+            on_delta: If provided, the response is streamed and this is called
+                with the text accumulated so far each time a chunk arrives.
+            use_cache: If False, always query the LLM (the fresh response
+                still replaces any cached one).
         """
         user_message = f"<transcription>\n{spoken_text}\n</transcription>"
         return self._chat(
@@ -145,6 +259,8 @@ class LLMClient:
             temperature=temperature,
             max_tokens=max_tokens,
             cancel_event=cancel_event,
+            on_delta=on_delta,
+            use_cache=use_cache,
         )
 
     # ------------------------------------------------------------------
@@ -160,6 +276,8 @@ class LLMClient:
         temperature: float | None = None,
         max_tokens: int | None = None,
         cancel_event: threading.Event | None = None,
+        on_delta: Callable[[str], None] | None = None,
+        use_cache: bool = True,
     ) -> str:
         """Send a chat-completion request and return the assistant content.
 
@@ -169,86 +287,135 @@ class LLMClient:
         If *cancel_event* is provided, the request can be cancelled by
         setting the event before it completes.
 
+        If *on_delta* is provided, the completion is streamed (SSE) and
+        *on_delta* receives the accumulated text as it grows.  The full
+        text is still returned at the end.
+
+        Requests with an effective temperature of 0 are deterministic, so
+        their responses are cached (LRU) and repeats return without a
+        network round-trip.  *use_cache* = ``False`` skips the lookup but
+        still stores the new response.
+
         Raises:
             httpx.HTTPStatusError: On 4xx / 5xx responses.
             KeyError / IndexError: If the response body is malformed.
             httpx.TimeoutException: On timeout.
             KeyboardInterrupt: If the request is cancelled via *cancel_event*.
         """
-        payload = {
-            "model": model or self.model,
-            "messages": [
-                {"role": "system", "content": system},
-                {"role": "user", "content": user},
-            ],
-            "temperature": temperature if temperature is not None else self.temperature,
-            "max_tokens": max_tokens if max_tokens is not None else self.max_tokens,
-        }
+        payload = self._payload_base.copy()
+        payload["messages"] = [
+            {"role": "system", "content": system},
+            {"role": "user", "content": user},
+        ]
+        if model:
+            payload["model"] = model
+        if temperature is not None:
+            payload["temperature"] = temperature
+        if max_tokens is not None:
+            payload["max_tokens"] = max_tokens
+        if on_delta is not None:
+            payload["stream"] = True
+        if self._send_prompt_cache_key:
+            payload["prompt_cache_key"] = _prompt_cache_key(system)
+
+        cache_key = None
+        if payload["temperature"] == 0:
+            cache_key = (payload["model"], payload["max_tokens"], system, user)
+            cached = None
+            if use_cache:
+                with self._response_cache_lock:
+                    cached = self._response_cache.get(cache_key)
+                    if cached is not None:
+                        self._response_cache.move_to_end(cache_key)
+            if cached is not None:
+                logger.debug("LLM response cache hit")
+                if on_delta is not None:
+                    try:
+                        on_delta(cached)
+                    except Exception:
+                        logger.debug("on_delta callback error", exc_info=True)
+                return cached
+
+        result = self._send(payload, cancel_event, on_delta)
+
+        if cache_key is not None:
+            with self._response_cache_lock:
+                self._response_cache[cache_key] = result
+                if len(self._response_cache) > _RESPONSE_CACHE_SIZE:
+                    self._response_cache.popitem(last=False)
+        return result
 
+    def _send(
+        self,
+        payload: dict,
+        cancel_event: threading.Event | None,
+        on_delta: Callable[[str], None] | None,
+    ) -> str:
+        """Run *payload* through _do_request, honouring *cancel_event* if given.
+
+        A cancellable request runs on the executor while this thread waits
+        for it to finish or for :meth:`abort`.  Cancelling raises at once;
+        an open stream is closed, while the shared client stays usable.
+        """
         # If no cancel event, use simple synchronous request
         if cancel_event is None:
-            return self._do_request(payload)
+            return self._do_request(payload, on_delta)
 
-        # With cancel event, use ThreadPoolExecutor with timeout
-        # This allows us to cancel even if the HTTP request is blocking
-        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
-
-        def _do_request_wrapper():
-            return self._do_request(payload)
+        if cancel_event.is_set():
+            raise KeyboardInterrupt("LLM request cancelled")
 
+        inflight = _InFlight()
+        with self._inflight_lock:
+            self._inflight.add(inflight)
         try:
-            # Submit the request
-            future = executor.submit(_do_request_wrapper)
-
-            # Poll for completion or cancellation (100ms intervals)
-            while not future.done():
+            future = self._executor.submit(self._do_request, payload, on_delta, inflight)
+            future.add_done_callback(lambda _f: inflight.wake.set())
+            # abort() wakes us immediately; the timeout only covers callers
+            # that set cancel_event without calling abort().
+            while not inflight.wake.wait(timeout=0.5):
                 if cancel_event.is_set():
-                    # Cancel the future
-                    future.cancel()
-                    # Try to close the client to abort the connection
+                    break
+            if cancel_event.is_set():
+                future.cancel()
+                response = inflight.response
+                if response is not None:
                     try:
-                        self._client.close()
+                        response.close()  # Abort the stream, not the client
                     except Exception:
                         pass
-                    # Shutdown the executor
-                    executor.shutdown(wait=False)
-                    raise KeyboardInterrupt("LLM request cancelled")
-
-                # Wait a bit before checking again
-                try:
-                    future.result(timeout=0.1)
-                except concurrent.futures.TimeoutError:
-                    continue
-                except concurrent.futures.CancelledError:
-                    raise KeyboardInterrupt("LLM request cancelled")
-
-            # Get the result
+                raise KeyboardInterrupt("LLM request cancelled")
             return future.result()
-
-        except KeyboardInterrupt:
-            raise
         except concurrent.futures.CancelledError:
-            raise KeyboardInterrupt("LLM request cancelled")
-        except Exception:
-            # Re-raise any other exception
-            raise
+            raise KeyboardInterrupt("LLM request cancelled") from None
         finally:
-            # Always shutdown the executor
-            try:
-                executor.shutdown(wait=False)
-            except Exception:
-                pass
+            with self._inflight_lock:
+                self._inflight.discard(inflight)
+
+    def abort(self) -> None:
+        """Wake every request waiting in :meth:`_send` so it checks its cancel event."""
+        with self._inflight_lock:
+            pending = list(self._inflight)
+        for inflight in pending:
+            inflight.wake.set()
 
-    def _do_request(self, payload: dict) -> str:
+    def _do_request(
+        self,
+        payload: dict,
+        on_delta: Callable[[str], None] | None = None,
+        inflight: _InFlight | None = None,
+    ) -> str:
         """Perform the actual HTTP request.
 
         Separated so it can be run in a thread for cancellation support.
         """
+        if on_delta is not None:
+            return self._do_stream_request(payload, on_delta, inflight)
+
         response = None
         try:
-            response = self._client.post("/chat/completions", json=payload)
+            response = self._client.post("/chat/completions", content=_json_dumps(payload))
             response.raise_for_status()
-            data = response.json()
+            data = _json_loads(response.content)
             return data["choices"][0]["message"]["content"]
         except httpx.HTTPStatusError as exc:
             logger.error("LLM API HTTP error %s: %s", exc.response.status_code, exc.response.text)
@@ -269,10 +436,72 @@ class LLMClient:
             logger.error("LLM request timed out: %s", exc)
             raise
 
+    def _do_stream_request(
+        self,
+        payload: dict,
+        on_delta: Callable[[str], None],
+        inflight: _InFlight | None = None,
+    ) -> str:
+        """Perform a streaming (SSE) request, reporting partial text via *on_delta*.
+
+        Falls back to a regular JSON body if the server ignores ``stream``.
+        """
+        try:
+            with self._client.stream(
+                "POST", "/chat/completions", content=_json_dumps(payload)
+            ) as response:
+                if inflight is not None:
+                    inflight.response = response
+                if response.is_error:
+                    response.read()
+                response.raise_for_status()
+
+                content_type = response.headers.get("content-type", "")
+                if "text/event-stream" not in content_type:
+                    data = _json_loads(response.read())
+                    return data["choices"][0]["message"]["content"]
+
+                text = ""
+                got_event = False
+                for line in response.iter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data_str = line[5:].strip()
+                    if data_str == "[DONE]":
+                        break
+                    got_event = True
+                    choices = _json_loads(data_str).get("choices") or []
+                    if not choices:
+                        continue
+                    piece = (choices[0].get("delta") or {}).get("content")
+                    if not piece:
+                        continue
+                    text += piece
+                    try:
+                        on_delta(text)
+                    except Exception:
+                        logger.debug("on_delta callback error", exc_info=True)
+
+                if not got_event:
+                    raise ValueError("LLM stream ended without any data events")
+                return text
+        except httpx.HTTPStatusError as exc:
+            logger.error("LLM API HTTP error %s: %s", exc.response.status_code, exc.response.text)
+            raise
+        except (KeyError, IndexError, ValueError) as exc:
+            # ValueError covers JSONDecodeError (invalid event payload)
+            logger.error("Malformed LLM stream response: %s", exc)
+            raise
+        except httpx.TimeoutException as exc:
+            logger.error("LLM request timed out: %s", exc)
+            raise
+
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
 
     def close(self) -> None:
         """Close the underlying HTTP client."""
+        self.abort()
+        self._executor.shutdown(wait=False, cancel_futures=True)
         self._client.close()
@@ -2,25 +2,37 @@
 
 from __future__ import annotations
 
-import copy
+import concurrent.futures
+import functools
 import logging
 import logging.handlers
 import os
+import queue
 import threading
 import time
+from dataclasses import dataclass, replace
+from typing import Callable
 
 import numpy as np
-import pyperclip
 
-from untype.audio import AudioRecorder, normalize_audio
+from untype.audio import AudioRecorder, warm_up_normalize
 from untype.build_info import HAS_LOCAL_STT
-from untype.clipboard import grab_selected_text, inject_text, release_all_modifiers
-from untype.config import AppConfig, Persona, load_config, load_personas, save_config
+from untype.clipboard import copy_text, grab_selected_text, inject_text, simulate_undo
+from untype.config import (
+    AppConfig,
+    Persona,
+    copy_config,
+    load_config,
+    load_personas,
+    save_config,
+)
 from untype.hotkey import HotkeyListener
 from untype.i18n import init_language, set_language
 from untype.llm import LLMClient
 from untype.overlay import CapsuleOverlay
 from untype.platform import (
+    DigitKeyInterceptor,
+    ForegroundWatcher,
     WindowIdentity,
     get_caret_screen_position,
     get_foreground_window,
@@ -31,6 +43,33 @@ from untype.tray import TrayApp
 
 logger = logging.getLogger(__name__)
 
+# Seconds without a further persona selection or capsule move before the
+# config is written to disk.
+_CONFIG_SAVE_DELAY = 0.5
+
+# Status strings shared by the tray and overlay.
+_STATUS_READY = "Ready"
+_STATUS_RECORDING = "Recording..."
+_STATUS_TRANSCRIBING = "Transcribing..."
+_STATUS_PROCESSING = "Processing..."
+_STATUS_ERROR = "Error"
+_STATUS_TIMEOUT = "Timeout"
+
+
+@dataclass(frozen=True, slots=True)
+class _InteractionState:
+    """Snapshot of a finished interaction, kept for ghost menu revert/regenerate."""
+
+    raw_text: str
+    result: str
+    persona: Persona | None
+    mode: str
+    selected_text: str | None
+    original_clipboard: str | None
+    target_window: WindowIdentity | None
+    caret_x: int
+    caret_y: int
+
 
 class UnTypeApp:
     """Main application orchestrator.
@@ -39,24 +78,36 @@ class UnTypeApp:
     client, and system tray icon into a push-to-talk pipeline.
     """
 
-    def __init__(self) -> None:
-        logger.info("Loading configuration...")
-        self._config = load_config()
-        # Deep copy so settings-change detection works (the dialog mutates in-place)
-        self._prev_config = copy.deepcopy(self._config)
+    def __init__(self, config: AppConfig | None = None) -> None:
+        if config is None:
+            logger.info("Loading configuration...")
+            config = load_config()
+        self._config = config
+        # Independent copy so settings-change detection works (the dialog mutates in-place)
+        self._prev_config = copy_config(self._config)
 
         # Initialize i18n with the configured language
         init_language(self._config.language)
 
         # -- Persona system -----------------------------------------------
-        self._personas: list[Persona] = load_personas()
+        self._personas: list[Persona] = []
+        # Derived from _personas by _set_personas(); read on the recording path.
+        self._active_personas: list[Persona] = []
+        # Immutable: the same tuple is handed to the overlay on every press.
+        self._active_persona_tuples: tuple[tuple[str, str, str], ...] = ()
+        self._active_persona_index: dict[str, int] = {}
+        self._personas_by_id: dict[str, Persona] = {}
+        # (persona id, mode) -> LLM overrides derived from that persona
+        self._llm_overrides_cache: dict[tuple[str, str], dict] = {}
+        # Bound once; passed to the overlay each time the persona bar is shown.
+        self._rec_persona_click_cb = self._on_rec_persona_click
+        self._set_personas(load_personas())
         if self._personas:
-            active_count = sum(1 for p in self._personas if p.active)
             logger.info(
                 "Loaded %d persona(s) (%d active): %s",
                 len(self._personas),
-                active_count,
-                ", ".join(p.name for p in self._personas if p.active),
+                len(self._active_personas),
+                ", ".join(p.name for p in self._active_personas),
             )
 
         # -- Interaction state (written in on_press, read in pipeline) --------
@@ -70,12 +121,20 @@ class UnTypeApp:
         self._held_result: str | None = None
         self._held_clipboard: str | None = None
         self._window_mismatch: bool = False
-        self._hwnd_watch_active: bool = False
+        # Set whenever no pipeline is watching the foreground window.
+        self._hwnd_watch_stop = threading.Event()
+        self._hwnd_watch_stop.set()
+        # Fallback poller, used only when the foreground hook is unavailable:
+        # created on first use and woken per pipeline, like the timeout monitor.
+        self._hwnd_poll_thread: threading.Thread | None = None
+        self._hwnd_poll_wake = threading.Event()
         self._caret_x: int = 0
         self._caret_y: int = 0
 
         # -- Pipeline lock: only one interaction at a time --------------------
         self._pipeline_lock = threading.Lock()
+        # Bumped each time an interaction takes the pipeline lock.
+        self._interaction_gen = 0
         # True only when _on_hotkey_press succeeded (lock acquired)
         self._press_active = False
         # Signalled once the press-setup thread finishes (recording started or error)
@@ -83,22 +142,42 @@ class UnTypeApp:
         self._recording_started.set()  # initially "done"
         # Emergency stop: set to abort the pipeline at the next checkpoint.
         self._cancel_requested = threading.Event()
+        # Long-lived workers for cleanup/stop calls that must not block the
+        # pipeline.  More than one worker so a call that hangs past its
+        # timeout doesn't hold up the next one.
+        self._bg_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="untype-bg"
+        )
+        # JIT-compile the gain kernel now rather than on the first release.
+        self._bg_executor.submit(self._warm_up_audio_kernels)
+        # Persistent workers for the hotkey path, so a press/release only
+        # enqueues a callable instead of creating a thread.  Recording start
+        # and the pipeline run concurrently, hence separate workers.
+        self._rec_start_q = self._start_worker("rec-start")
+        self._pipeline_q = self._start_worker("pipeline")
+        self._cleanup_q = self._start_worker("cleanup")
+        # Persona selections and capsule moves are saved here, debounced: a
+        # burst of digit presses or drags produces one write, shortly after
+        # the last one.
+        self._config_save_q = self._start_worker("config-save")
+        self._config_save_timer: threading.Timer | None = None
+        self._config_save_lock = threading.Lock()
 
         # -- Recording timeout protection ------------------------------------
-        self._timeout_timer: threading.Thread | None = None  # Timer thread for duration check
-        self._stop_timeout_timer = threading.Event()  # Signal to stop the timer
+        # One long-lived monitor thread, started here (off the hotkey path)
+        # and woken per recording.
+        self._timeout_wake = threading.Event()  # Signal a recording has started
+        self._stop_timeout_timer = threading.Event()  # Signal to stop monitoring
         self._stop_timeout_timer.set()  # Initially "stopped"
+        self._start_daemon_thread(self._timeout_monitor_worker, "timeout-monitor")
 
         # -- Last interaction state (for ghost menu revert/regenerate) ------
-        self._last_raw_text: str | None = None
-        self._last_result: str | None = None
-        self._last_persona: Persona | None = None
-        self._last_mode: str | None = None
-        self._last_selected_text: str | None = None
-        self._last_original_clipboard: str | None = None
-        self._last_target_window: WindowIdentity | None = None
-        self._last_caret_x: int = 0
-        self._last_caret_y: int = 0
+        # Replaced as a whole, never mutated field by field.
+        self._last_state: _InteractionState | None = None
+
+        # Where recorder audio chunks go: the streaming STT engine's
+        # on_audio_chunk, or None.  Bound per engine, not checked per chunk.
+        self._audio_chunk_sink: Callable[[np.ndarray], None] | None = None
 
         # -- Initialise subsystems -------------------------------------------
         logger.info("Initialising audio recorder...")
@@ -119,6 +198,7 @@ class UnTypeApp:
 
         logger.info("Initialising STT engine (this may take a moment)...")
         self._stt = self._init_stt()
+        self._bind_audio_chunk_sink()
 
         logger.info("Initialising LLM client...")
         self._llm: LLMClient | None = self._init_llm_client()
@@ -131,6 +211,11 @@ class UnTypeApp:
             mode=self._config.hotkey.mode,
             on_escape=self._on_cancel,
         )
+        self._ready_log_msg = (
+            "Press %s to start/stop recording."
+            if self._config.hotkey.mode == "toggle"
+            else "Hold %s to speak."
+        ) % self._config.hotkey.trigger
 
         logger.info("Initialising overlay...")
         self._overlay = CapsuleOverlay(
@@ -148,20 +233,59 @@ class UnTypeApp:
         )
 
         logger.info("Initialising digit key interceptor...")
-        from untype._platform_win32 import DigitKeyInterceptor
-
         self._digit_interceptor = DigitKeyInterceptor(
             on_digit=self._on_digit_during_recording,
         )
 
+        logger.info("Initialising foreground window watcher...")
+        self._fg_watcher = ForegroundWatcher(on_change=self._on_foreground_changed)
+
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
 
-    @property
-    def _active_personas(self) -> list[Persona]:
-        """Return only active personas (shown during recording)."""
-        return [p for p in self._personas if p.active]
+    def _set_personas(self, personas: list[Persona]) -> None:
+        """Replace the persona list and rebuild the active-persona caches.
+
+        Active personas are the ones shown during recording; their
+        ``(id, icon, name)`` tuples and id → index map are precomputed here
+        so the recording-start path does no per-press scanning.  An id →
+        persona map over all personas serves staging-bar selections.
+        """
+        active = [p for p in personas if p.active]
+        self._personas = personas
+        self._personas_by_id = {p.id: p for p in personas}
+        self._active_personas = active
+        self._active_persona_tuples = tuple((p.id, p.icon, p.name) for p in active)
+        self._active_persona_index = {p.id: idx for idx, p in enumerate(active)}
+        self._llm_overrides_cache = {}
+
+    def _start_worker(self, name: str) -> queue.SimpleQueue:
+        """Start a persistent daemon worker and return the queue it drains.
+
+        Callables put on the queue run one at a time on the worker thread
+        (named "untype-<name>").  Exceptions are logged so the worker survives.
+        """
+        jobs: queue.SimpleQueue = queue.SimpleQueue()
+
+        def _drain() -> None:
+            while True:
+                job = jobs.get()
+                try:
+                    job()
+                except Exception:
+                    logger.exception("Unhandled error in %s worker", name)
+
+        self._start_daemon_thread(_drain, name)
+        return jobs
+
+    @staticmethod
+    def _warm_up_audio_kernels() -> None:
+        """Compile the audio gain kernel in the background (runs on _bg_executor)."""
+        try:
+            warm_up_normalize()
+        except Exception:
+            logger.warning("Audio kernel warm-up failed", exc_info=True)
 
     def _start_daemon_thread(self, target, name: str) -> None:
         """Start a daemon thread with consistent naming convention.
@@ -180,22 +304,22 @@ class UnTypeApp:
     # Public API
     # ------------------------------------------------------------------
 
-    def run(self) -> None:
+    def run(self, *, setup_completed: bool = False) -> None:
         """Start the application.
 
         Starts the hotkey listener, then runs the system-tray icon which
-        blocks until the user quits.
+        blocks until the user quits.  With *setup_completed* (the first-run
+        wizard just finished), a notice points the user at the tray icon.
         """
         self._hotkey.start()
         self._overlay.start()
+        if setup_completed:
+            # Give the tray icon a moment to appear first.
+            self._overlay.show_setup_complete_notice(delay_ms=1500)
         self._digit_interceptor.start()
-        mode_hint = (
-            "Press %s to start/stop recording."
-            if self._config.hotkey.mode == "toggle"
-            else "Hold %s to speak."
-        )
-        logger.info("UnType is ready.  " + mode_hint, self._config.hotkey.trigger)
-        self._tray.update_status("Ready")
+        self._fg_watcher.start()
+        logger.info("UnType is ready.  %s", self._ready_log_msg)
+        self._tray.update_status(_STATUS_READY)
 
         # tray.run() blocks until the user selects Quit.
         self._tray.run()
@@ -211,12 +335,13 @@ class UnTypeApp:
         callback.  On Windows the hook has a strict timeout (~300 ms).
         If we block too long here, Windows removes the hook and the
         hotkey listener dies silently.  Therefore we only acquire the
-        pipeline lock and immediately spawn a worker thread for the
-        heavy clipboard-probe + recording-start work.
+        pipeline lock and immediately hand the heavy clipboard-probe +
+        recording-start work to the rec-start worker.
         """
         if not self._pipeline_lock.acquire(blocking=False):
             logger.warning("Pipeline already running — ignoring hotkey press")
             return
+        self._interaction_gen += 1
 
         self._cancel_requested.clear()
 
@@ -225,38 +350,38 @@ class UnTypeApp:
 
         # Safety net: if there's a held result from a previous HWND mismatch,
         # copy it to clipboard before discarding so the user doesn't lose it.
-        if self._held_result is not None:
+        # The copy can block on the clipboard, so it runs on the rec-start
+        # worker, ahead of (and never concurrently with) the clipboard probe.
+        held = self._held_result
+        if held is not None:
             logger.info("Discarding held result to clipboard before new interaction")
-            try:
-                pyperclip.copy(self._held_result)
-            except Exception:
-                pass
             self._held_result = None
             self._held_clipboard = None
+            self._rec_start_q.put(functools.partial(copy_text, held))
             self._overlay.hide_hold_bubble()
 
         self._press_active = True
         self._recording_started.clear()
-        self._start_daemon_thread(self._start_recording, "rec-start")
+        self._rec_start_q.put(self._start_recording)
 
     def _on_hotkey_release(self) -> None:
         """Called when the push-to-talk hotkey is released.
 
-        Spawns a background thread to run the rest of the pipeline so that
-        the hotkey listener is not blocked.
+        Queues the rest of the pipeline on the pipeline worker so that the
+        hotkey listener is not blocked.
 
-        IMPORTANT: We ALWAYS start a thread to ensure _pipeline_lock gets released,
+        IMPORTANT: We ALWAYS queue a job to ensure _pipeline_lock gets released,
         even if _press_active was already set to False by _on_cancel (cancel scenario).
         """
         was_active = self._press_active
         self._press_active = False
         # Only start pipeline if this was a genuine hotkey press (not spurious release)
         if was_active:
-            self._start_daemon_thread(self._process_pipeline, "pipeline")
+            self._pipeline_q.put(self._process_pipeline)
         else:
-            # Hotkey released but press was already cancelled - start cleanup-only thread
-            # to ensure the lock gets released
-            self._start_daemon_thread(self._cleanup_after_cancel, "cleanup-after-cancel")
+            # Hotkey released but press was already cancelled - queue a cleanup-only
+            # job to ensure the lock gets released
+            self._cleanup_q.put(self._cleanup_after_cancel)
 
     # ------------------------------------------------------------------
     # Emergency stop
@@ -267,6 +392,11 @@ class UnTypeApp:
         logger.info("Cancel requested by user")
         self._cancel_requested.set()
 
+        # Wake a pending LLM request so the pipeline unwinds immediately.
+        llm = self._llm
+        if llm is not None:
+            llm.abort()
+
         # Stop timeout monitor
         self._stop_timeout_monitor()
 
@@ -280,7 +410,7 @@ class UnTypeApp:
         self._digit_interceptor.set_active(False)
 
         # Stop HWND watcher.
-        self._hwnd_watch_active = False
+        self._hwnd_watch_stop.set()
 
         # Hide all overlays.
         self._overlay.hide()
@@ -293,13 +423,13 @@ class UnTypeApp:
         self._overlay._staging_event.set()
 
         # Update tray status.
-        self._tray.update_status("Ready")
+        self._tray.update_status(_STATUS_READY)
 
         # CRITICAL: If user cancelled while still holding the hotkey,
         # start cleanup immediately instead of waiting for hotkey release.
         if self._press_active:
             logger.info("Starting immediate cleanup (hotkey still held)")
-            self._start_daemon_thread(self._cleanup_after_cancel, "cleanup-after-cancel")
+            self._cleanup_q.put(self._cleanup_after_cancel)
 
     def _cleanup_after_cancel(self) -> None:
         """Cleanup-only variant of _process_pipeline for cancel scenarios.
@@ -331,7 +461,7 @@ class UnTypeApp:
                 pass
         finally:
             # Always release the lock
-            self._hwnd_watch_active = False
+            self._hwnd_watch_stop.set()
             self._digit_interceptor.set_active(False)
             self._cancel_requested.clear()
             self._pipeline_lock.release()
@@ -349,8 +479,8 @@ class UnTypeApp:
         (insert vs polish) is determined after recording is already
         capturing audio.
 
-        This is spawned by :meth:`_on_hotkey_press` on a short-lived worker
-        thread so the keyboard hook callback returns immediately.  The
+        This is queued by :meth:`_on_hotkey_press` on the rec-start worker
+        so the keyboard hook callback returns immediately.  The
         ``_recording_started`` event is set in the ``finally`` block to let
         the pipeline thread know it can proceed.
         """
@@ -390,19 +520,32 @@ class UnTypeApp:
                         self._overlay.update_status("连接失败，请检查网络")
                         # Don't abort - fall through to recording anyway
 
+            # Checkpoint: cancelled while connecting?  Return early so the
+            # pipeline (waiting on _recording_started) can clean up right away.
+            if self._cancel_requested.is_set():
+                logger.info("Cancelled before recording start")
+                return
+
             # Start recording. For non-realtime backends, this happens first.
             # For realtime, we wait for the session to be ready.
             logger.info("Starting audio recording...")
             self._recorder.start()
-            self._tray.update_status("Recording...")
+
+            # Checkpoint: cancelled while the device was opening?  Skip the UI
+            # that _on_cancel has already hidden; the pipeline aborts the recorder.
+            if self._cancel_requested.is_set():
+                logger.info("Cancelled right after recording start")
+                return
+
+            self._tray.update_status(_STATUS_RECORDING)
 
             # Update capsule status to Recording...
             if self._config.stt.backend == "realtime_api" and session_ready:
                 # Capsule already shown, just update status
-                self._overlay.update_status("Recording...")
+                self._overlay.update_status(_STATUS_RECORDING)
             else:
                 # Show capsule with Recording status
-                self._overlay.show(self._caret_x, self._caret_y, "Recording...")
+                self._overlay.show(self._caret_x, self._caret_y, _STATUS_RECORDING)
 
             # Start the timeout monitor thread
             self._start_timeout_monitor()
@@ -410,24 +553,21 @@ class UnTypeApp:
             # Show recording persona bar (if personas configured).
             self._preselected_persona = None
             if self._active_personas:
-                persona_tuples = [(p.id, p.icon, p.name) for p in self._active_personas]
                 self._overlay.show_recording_personas(
-                    persona_tuples,
+                    self._active_persona_tuples,
                     self._caret_x,
                     self._caret_y,
-                    on_click=self._on_rec_persona_click,
+                    on_click=self._rec_persona_click_cb,
                 )
                 self._digit_interceptor.set_active(True)
 
                 # Auto-select the remembered persona (if any and exists)
-                last_id = self._config.last_selected_persona
-                if last_id:
-                    for idx, p in enumerate(self._active_personas):
-                        if p.id == last_id:
-                            self._preselected_persona = p
-                            self._overlay.select_recording_persona(idx)
-                            logger.info("Auto-selected remembered persona: %s", p.name)
-                            break
+                idx = self._active_persona_index.get(self._config.last_selected_persona)
+                if idx is not None:
+                    p = self._active_personas[idx]
+                    self._preselected_persona = p
+                    self._overlay.select_recording_persona(idx)
+                    logger.info("Auto-selected remembered persona: %s", p.name)
 
             # Show realtime preview (after all UI elements are positioned)
             if self._config.stt.backend == "realtime_api" and session_ready:
@@ -450,8 +590,8 @@ class UnTypeApp:
 
         except Exception:
             logger.exception("Error starting recording")
-            self._tray.update_status("Error")
-            self._overlay.update_status("Error")
+            self._tray.update_status(_STATUS_ERROR)
+            self._overlay.update_status(_STATUS_ERROR)
         finally:
             # Always signal so the pipeline thread never hangs.
             logger.debug("_start_recording: setting _recording_started event")
@@ -462,6 +602,38 @@ class UnTypeApp:
     # Pipeline
     # ------------------------------------------------------------------
 
+    def _abort_recording_and_stt(self) -> None:
+        """Abort the recorder and any realtime STT session (runs on _bg_executor)."""
+        if self._recorder.is_recording:
+            logger.debug("Cleanup: aborting recorder")
+            self._recorder.abort()
+        if isinstance(self._stt, STTRealtimeApiEngine):
+            logger.debug("Cleanup: stopping STT session")
+            self._stt.stop_session()
+        logger.debug("Cleanup: complete")
+
+    def _run_cancel_cleanup(self) -> None:
+        """Release recording/STT resources after a cancel and reset the UI.
+
+        The resource cleanup runs on the background executor with a timeout
+        so a stuck audio driver or STT connection can't hang the pipeline.
+        """
+        try:
+            future = self._bg_executor.submit(self._abort_recording_and_stt)
+            future.result(timeout=2.0)  # Max 2 seconds for cleanup
+        except concurrent.futures.TimeoutError:
+            logger.warning("Cleanup timed out - proceeding anyway")
+        except Exception as e:
+            logger.warning("Cleanup error: %s", e)
+
+        self._reset_to_ready()
+
+    def _reset_to_ready(self, hide_preview: bool = True) -> None:
+        """Deactivate digit selection and return the tray and overlay to idle."""
+        self._digit_interceptor.set_active(False)
+        self._overlay.reset_to_ready(hide_preview=hide_preview)
+        self._tray.update_status(_STATUS_READY)
+
     def _process_pipeline(self) -> None:
         """Run the full STT -> staging -> (optional LLM) -> inject pipeline."""
         logger.debug("_process_pipeline: starting, waiting for _recording_started")
@@ -472,8 +644,8 @@ class UnTypeApp:
                 logger.error("Timeout waiting for recording to start - aborting pipeline")
                 self._digit_interceptor.set_active(False)
                 self._overlay.hide_recording_personas()
-                self._tray.update_status("Error")
-                self._overlay.update_status("Timeout")
+                self._tray.update_status(_STATUS_ERROR)
+                self._overlay.update_status(_STATUS_TIMEOUT)
                 self._overlay.hide()
                 return
 
@@ -482,135 +654,62 @@ class UnTypeApp:
             # Checkpoint: cancel requested during recording start?
             if self._cancel_requested.is_set():
                 logger.info("Pipeline cancelled after recording start - initiating cleanup")
-                # CRITICAL: Must abort the recorder immediately when cancelled
-                # Use ThreadPoolExecutor with timeout to avoid blocking
-                import concurrent.futures
-
-                def _cleanup_resources():
-                    if self._recorder.is_recording:
-                        logger.debug("Cleanup: aborting recorder")
-                        self._recorder.abort()
-                    if isinstance(self._stt, STTRealtimeApiEngine):
-                        logger.debug("Cleanup: stopping STT session")
-                        self._stt.stop_session()
-                    logger.debug("Cleanup: complete")
-
-                executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
-                try:
-                    future = executor.submit(_cleanup_resources)
-                    future.result(timeout=2.0)  # Max 2 seconds for cleanup
-                except concurrent.futures.TimeoutError:
-                    logger.warning("Cleanup timed out - proceeding anyway")
-                except Exception as e:
-                    logger.warning("Cleanup error: %s", e)
-                finally:
-                    executor.shutdown(wait=False)
+                self._run_cancel_cleanup()
                 return
 
             if not self._recorder.is_recording:
                 logger.warning("Recording not active — aborting pipeline")
-                self._digit_interceptor.set_active(False)
-                self._overlay.hide_recording_personas()
-                self._tray.update_status("Ready")
-                self._overlay.hide()
+                self._reset_to_ready(hide_preview=False)
                 return
 
             # Checkpoint: cancel requested before stopping recording?
             if self._cancel_requested.is_set():
                 logger.info("Pipeline cancelled before recording stop - initiating cleanup")
-                # CRITICAL: Must abort the recorder immediately when cancelled
-                # Use ThreadPoolExecutor with timeout to avoid blocking
-                import concurrent.futures
-
-                def _cleanup_resources():
-                    if self._recorder.is_recording:
-                        logger.debug("Cleanup: aborting recorder")
-                        self._recorder.abort()
-                    if isinstance(self._stt, STTRealtimeApiEngine):
-                        logger.debug("Cleanup: stopping STT session")
-                        self._stt.stop_session()
-
-                executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
-                try:
-                    future = executor.submit(_cleanup_resources)
-                    future.result(timeout=2.0)  # Max 2 seconds for cleanup
-                except concurrent.futures.TimeoutError:
-                    logger.warning("Cleanup timed out - proceeding anyway")
-                except Exception as e:
-                    logger.warning("Cleanup error: %s", e)
-                finally:
-                    executor.shutdown(wait=False)
-
-                self._digit_interceptor.set_active(False)
-                self._overlay.hide_recording_personas()
-                self._overlay.hide_realtime_preview()
-                self._tray.update_status("Ready")
-                self._overlay.hide()
+                self._run_cancel_cleanup()
                 return
 
             # 1. Stop recording and retrieve audio.
             logger.info("Stopping audio recording...")
             self._stop_timeout_monitor()  # Stop timeout monitor before stopping recorder
-            audio = self._recorder.stop()
+            audio = self._recorder.stop(out=self._audio_scratch)
 
             # Checkpoint: cancel requested during recording stop?
             if self._cancel_requested.is_set():
                 logger.info("Pipeline cancelled after recording stop")
                 return
 
-            if audio.size == 0:
+            if not self._recorder.last_sample_count:
                 logger.warning("Empty audio buffer — aborting pipeline")
-                self._digit_interceptor.set_active(False)
-                self._overlay.hide_recording_personas()
-                self._overlay.hide_realtime_preview()
-                self._tray.update_status("Ready")
-                self._overlay.hide()
+                self._reset_to_ready()
                 return
 
             # 2. Transcribe (or get realtime result).
             # IMPORTANT: Check cancel before STT processing
             if self._cancel_requested.is_set():
                 logger.info("Pipeline cancelled before STT processing")
-                # Still need to cleanup
-                try:
-                    if isinstance(self._stt, STTRealtimeApiEngine):
-                        self._stt.stop_session()
-                except Exception:
-                    pass
-                self._digit_interceptor.set_active(False)
-                self._overlay.hide_recording_personas()
-                self._overlay.hide_realtime_preview()
-                self._tray.update_status("Ready")
-                self._overlay.hide()
+                self._run_cancel_cleanup()
                 return
 
             if self._config.stt.backend == "realtime_api":
-                # For realtime API, use ThreadPoolExecutor to prevent blocking
+                # For realtime API, stop on the background executor to prevent blocking
                 logger.info("Stopping realtime recognition session...")
                 if isinstance(self._stt, STTRealtimeApiEngine):
-                    import concurrent.futures
-
-                    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
                     try:
-                        future = executor.submit(self._stt.stop_session)
+                        future = self._bg_executor.submit(self._stt.stop_session)
                         text = future.result(timeout=3.0)  # 3 second timeout
                     except concurrent.futures.TimeoutError:
                         logger.warning("STT stop_session timed out - forcing cleanup")
                         text = self._stt.get_result()
-                    finally:
-                        executor.shutdown(wait=False)
                 else:
                     text = ""
                 text = text.strip()
             else:
                 # For API and local backends, normalize and transcribe.
-                self._tray.update_status("Transcribing...")
-                self._overlay.update_status("Transcribing...")
-                logger.info("Normalising audio (gain=%.1f)...", self._config.audio.gain_boost)
-                audio = normalize_audio(audio, self._config.audio.gain_boost)
-
-                logger.info("Transcribing audio...")
-                text = self._stt.transcribe(audio)
+                self._tray.update_status(_STATUS_TRANSCRIBING)
+                self._overlay.update_status(_STATUS_TRANSCRIBING)
+                # The engine applies the gain boost as part of its own conversion.
+                logger.info("Transcribing audio (gain=%.1f)...", self._config.audio.gain_boost)
+                text = self._stt.transcribe(audio, gain=self._config.audio.gain_boost)
                 text = text.strip()
 
             # Checkpoint: cancel requested during transcription?
@@ -620,11 +719,7 @@ class UnTypeApp:
 
             if not text:
                 logger.warning("Empty transcription — aborting pipeline")
-                self._digit_interceptor.set_active(False)
-                self._overlay.hide_recording_personas()
-                self._overlay.hide_realtime_preview()
-                self._tray.update_status("Ready")
-                self._overlay.hide()
+                self._reset_to_ready()
                 return
 
             logger.info("Transcription: %s", text)
@@ -641,26 +736,61 @@ class UnTypeApp:
 
         except Exception:
             logger.exception("Pipeline error")
-            self._hwnd_watch_active = False
+            self._hwnd_watch_stop.set()
             self._digit_interceptor.set_active(False)
-            self._tray.update_status("Error")
-            self._overlay.update_status("Error")
-            # Briefly show the error status, then revert to Ready.
-            time.sleep(2)
-            self._tray.update_status("Ready")
-            self._overlay.hide()
-            self._overlay.hide_recording_personas()
+            self._tray.update_status(_STATUS_ERROR)
+            self._overlay.update_status(_STATUS_ERROR)
+            # Briefly show the error status, then revert to Ready.  A timer
+            # does the revert so the pipeline lock is released right away.
+            revert = threading.Timer(2.0, self._revert_error_status, args=(self._interaction_gen,))
+            revert.daemon = True
+            revert.start()
         finally:
-            self._hwnd_watch_active = False
+            self._hwnd_watch_stop.set()
             self._digit_interceptor.set_active(False)
             self._cancel_requested.clear()
             self._pipeline_lock.release()
 
-    def _run_llm(self, transcribed_text: str, persona: Persona | None = None) -> str:
+    def _revert_error_status(self, gen: int) -> None:
+        """Clear the "Error" status shown by interaction *gen* after a failure."""
+        # Leave the UI alone if a new interaction started in the meantime.
+        # Compared, never locked: holding the pipeline lock here would make
+        # a press landing at this moment get rejected.
+        if gen != self._interaction_gen:
+            return
+        self._tray.update_status(_STATUS_READY)
+        self._overlay.reset_to_ready(hide_preview=False)
+
+    def _persona_llm_overrides(self, persona: Persona) -> dict:
+        """Return the LLM call overrides *persona* defines for the current mode."""
+        overrides: dict = {}
+        if self._mode == "polish" and persona.prompt_polish:
+            overrides["system_prompt"] = persona.prompt_polish
+        elif self._mode == "insert" and persona.prompt_insert:
+            overrides["system_prompt"] = persona.prompt_insert
+        if persona.model:
+            overrides["model"] = persona.model
+        if persona.temperature is not None:
+            overrides["temperature"] = persona.temperature
+        if persona.max_tokens is not None:
+            overrides["max_tokens"] = persona.max_tokens
+        return overrides
+
+    def _run_llm(
+        self,
+        transcribed_text: str,
+        persona: Persona | None = None,
+        use_cache: bool = True,
+        at_corner: bool = False,
+    ) -> str:
         """Send transcribed text through the LLM, falling back to raw text.
 
         If *persona* is provided, its prompt/model/temperature/max_tokens
         overrides are passed to the LLM client for this single call.
+        Identical deterministic requests are answered from the client's
+        response cache unless *use_cache* is False.  The response streams
+        into a preview below the capsule, except when the capsule is parked
+        at the screen corner (*at_corner*), where there is no room for it.
 
         The LLM call can be cancelled by setting _cancel_requested event.
         """
@@ -668,22 +798,23 @@ class UnTypeApp:
             logger.warning("LLM not configured — using raw transcription")
             return transcribed_text
 
-        # Build per-call overrides from persona.
+        # Build per-call overrides from persona (cached until personas reload).
         overrides: dict = {}
         if persona:
-            if self._mode == "polish" and persona.prompt_polish:
-                overrides["system_prompt"] = persona.prompt_polish
-            elif self._mode == "insert" and persona.prompt_insert:
-                overrides["system_prompt"] = persona.prompt_insert
-            if persona.model:
-                overrides["model"] = persona.model
-            if persona.temperature is not None:
-                overrides["temperature"] = persona.temperature
-            if persona.max_tokens is not None:
-                overrides["max_tokens"] = persona.max_tokens
-
+            key = (persona.id, self._mode)
+            base = self._llm_overrides_cache.get(key)
+            if base is None:
+                base = self._persona_llm_overrides(persona)
+                self._llm_overrides_cache[key] = base
+            overrides.update(base)
+
+        overrides["use_cache"] = use_cache
         # Pass cancel_event to enable interruption
         overrides["cancel_event"] = self._cancel_requested
+        # Stream the response into the preview window as it is generated.
+        if not at_corner:
+            overrides["on_delta"] = self._overlay.update_realtime_preview
+            self._overlay.show_realtime_preview(self._caret_x, self._caret_y)
 
         try:
             if self._mode == "polish":
@@ -702,6 +833,9 @@ class UnTypeApp:
         except Exception:
             logger.exception("LLM request failed — falling back to raw transcription")
             return transcribed_text
+        finally:
+            if not at_corner:
+                self._overlay.hide_realtime_preview()
 
     def _process_with_personas(self, text: str) -> None:
         """Fast-lane: skip staging, go directly to LLM (with optional persona).
@@ -717,78 +851,18 @@ class UnTypeApp:
         else:
             logger.info("No persona pre-selected — using default LLM processing")
 
-        self._hwnd_watch_active = False
-        at_corner = self._window_mismatch
-
-        if at_corner:
-            # Capsule is already parked at the corner from a prior HWND
-            # mismatch — just update its status text in place.
-            self._overlay.update_status("Processing...")
-        else:
-            self._overlay.show(self._caret_x, self._caret_y, "Processing...")
-        self._tray.update_status("Processing...")
-
-        # Restart HWND monitoring during the LLM call.
-        self._start_hwnd_watcher()
-
-        # Check if cancel was already requested before starting LLM
-        if self._cancel_requested.is_set():
-            logger.info("Pipeline cancelled before LLM call (fast-lane)")
-            self._hwnd_watch_active = False
-            self._overlay.hide()
-            self._tray.update_status("Ready")
-            return
-
-        try:
-            result = self._run_llm(text, persona=persona)
-        except KeyboardInterrupt:
-            # LLM request was cancelled by user
-            logger.info("Pipeline cancelled during LLM (fast-lane)")
-            self._hwnd_watch_active = False
-            self._overlay.hide()
-            self._tray.update_status("Ready")
-            return
-        except Exception as e:
-            logger.exception(f"Pipeline error in _process_with_personas: {e}")
-            self._hwnd_watch_active = False
-            self._overlay.hide()
-            self._tray.update_status("Ready")
-            return
-
-        # IMPORTANT: Check cancel again immediately after LLM returns
-        # User may have cancelled while LLM was processing (HTTP may have completed)
-        if self._cancel_requested.is_set():
-            logger.info("Pipeline cancelled after LLM returned (fast-lane)")
-            self._hwnd_watch_active = False
-            self._overlay.hide()
-            self._tray.update_status("Ready")
-            return
-
-        # Stop watcher and verify window before injection.
-        self._hwnd_watch_active = False
-        if not self._verify_window_safety():
-            logger.warning(
-                "Window changed during LLM processing — holding result",
-            )
-            self._save_interaction_state(text, result, persona=persona, show_ghost=False)
-            self._held_result = result
-            self._held_clipboard = self._original_clipboard
-            self._overlay.fly_to_hold_bubble(result)
-            self._tray.update_status("Ready")
-            return
-
-        logger.info("Injecting refined text (%d chars)", len(result))
-        inject_text(result, self._original_clipboard)
-        self._save_interaction_state(text, result, persona=persona)
-        self._overlay.hide()
-        self._tray.update_status("Ready")
-        logger.info("Pipeline complete (fast-lane)")
+        self._hwnd_watch_stop.set()
+        # If the capsule is already parked at the corner from a prior HWND
+        # mismatch, its status text is updated in place.
+        self._refine_and_inject(
+            text, text, persona, context="Fast-lane", at_corner=self._window_mismatch
+        )
 
     def _process_with_staging(self, text: str) -> None:
         """Show staging area for manual editing (no personas configured)."""
-        self._hwnd_watch_active = False
+        self._hwnd_watch_stop.set()
         at_corner = self._window_mismatch
-        self._tray.update_status("Ready")
+        self._tray.update_status(_STATUS_READY)
 
         if at_corner:
             self._overlay.show_staging(text, 0, 0, at_corner=True)
@@ -821,95 +895,171 @@ class UnTypeApp:
             return
 
         # action == "refine" — send through LLM.
-        self._overlay.show(self._caret_x, self._caret_y, "Processing...")
-        self._tray.update_status("Processing...")
+        self._refine_and_inject(text, edited_text, context="Staging")
 
-        # Restart HWND monitoring during the LLM call.
-        self._start_hwnd_watcher()
+    def _refine_and_inject(
+        self,
+        raw_text: str,
+        llm_text: str,
+        persona: Persona | None = None,
+        *,
+        context: str,
+        use_cache: bool = True,
+        at_corner: bool = False,
+    ) -> None:
+        """Run *llm_text* through the LLM and inject the result.
+
+        Shared tail of the fast-lane, staging and ghost-menu paths.  The
+        foreground window is watched during the call; if the target lost
+        focus the result is parked in the hold bubble instead.  However this
+        returns, the watcher is stopped and the tray is back to Ready.
+        *context* prefixes log messages.
+        """
+        if at_corner:
+            self._overlay.update_status(_STATUS_PROCESSING)
+        else:
+            self._overlay.show(self._caret_x, self._caret_y, _STATUS_PROCESSING)
+        self._tray.update_status(_STATUS_PROCESSING)
 
+        # Watch for window switches during the LLM call.
+        self._start_hwnd_watcher()
+        capsule_done = False  # UI already returned to idle / handed to the hold bubble
         try:
-            result = self._run_llm(edited_text)
-        except KeyboardInterrupt:
-            # LLM request was cancelled by user
-            logger.info("Pipeline cancelled during LLM (staging)")
-            self._hwnd_watch_active = False
-            self._overlay.hide()
-            self._tray.update_status("Ready")
-            return
-        except Exception as e:
-            logger.exception(f"Pipeline error in _process_with_staging LLM: {e}")
-            self._hwnd_watch_active = False
-            self._overlay.hide()
-            self._tray.update_status("Ready")
-            return
+            if self._cancel_requested.is_set():
+                logger.info("%s: cancelled before LLM call", context)
+                return
 
-        # IMPORTANT: Check cancel again immediately after LLM returns
-        if self._cancel_requested.is_set():
-            logger.info("Pipeline cancelled after LLM returned (staging)")
-            self._hwnd_watch_active = False
-            self._overlay.hide()
-            self._tray.update_status("Ready")
-            return
+            try:
+                result = self._run_llm(
+                    llm_text, persona=persona, use_cache=use_cache, at_corner=at_corner
+                )
+            except KeyboardInterrupt:
+                logger.info("%s: LLM cancelled by user", context)
+                return
+            except Exception:
+                logger.exception("%s: LLM error", context)
+                return
 
-        # Stop watcher and verify window before injection.
-        self._hwnd_watch_active = False
-        if not self._verify_window_safety():
-            logger.warning(
-                "Window changed during LLM processing — holding result",
-            )
-            self._save_interaction_state(text, result, show_ghost=False)
-            self._held_result = result
-            self._held_clipboard = self._original_clipboard
-            self._overlay.fly_to_hold_bubble(result)
-            self._tray.update_status("Ready")
-            return
+            # The HTTP call may have completed just as the user cancelled.
+            if self._cancel_requested.is_set():
+                logger.info("%s: cancelled after LLM returned", context)
+                return
 
-        logger.info("Injecting refined text (%d chars)", len(result))
-        inject_text(result, self._original_clipboard)
-        self._save_interaction_state(text, result)
-        self._overlay.hide()
-        self._tray.update_status("Ready")
-        logger.info("Pipeline complete")
+            # Stop watcher and verify window before injection.
+            self._hwnd_watch_stop.set()
+            if not self._verify_window_safety():
+                logger.warning("%s: window changed during LLM — holding result", context)
+                self._save_interaction_state(
+                    raw_text,
+                    result,
+                    persona=persona,
+                    show_ghost=False,
+                )
+                self._held_result = result
+                self._held_clipboard = self._original_clipboard
+                self._overlay.fly_to_hold_bubble(result)
+                self._tray.update_status(_STATUS_READY)
+                capsule_done = True
+                return
+
+            # Return the UI to idle before the paste rather than after it.
+            # The paste itself stays on this thread, under the pipeline lock,
+            # so a new press can't probe the clipboard while it is borrowed.
+            self._overlay.hide()
+            self._tray.update_status(_STATUS_READY)
+            capsule_done = True
+            logger.info("%s: injecting refined text (%d chars)", context, len(result))
+            inject_text(result, self._original_clipboard)
+            self._save_interaction_state(raw_text, result, persona=persona)
+            logger.info("%s: pipeline complete", context)
+        finally:
+            self._hwnd_watch_stop.set()
+            if not capsule_done:
+                self._overlay.hide()
+                self._tray.update_status(_STATUS_READY)
 
     # ------------------------------------------------------------------
-    # HWND watcher (Phase 2 — polls foreground window during pipeline)
+    # HWND watcher (Phase 2 — watches foreground window during pipeline)
     # ------------------------------------------------------------------
 
     def _start_hwnd_watcher(self) -> None:
-        """Begin polling the foreground window on a daemon thread."""
+        """Begin watching the foreground window for a switch away from the target.
+
+        Foreground changes are reported by the platform's WinEvent hook;
+        where that is unavailable, a long-lived daemon thread polls instead.
+        """
         self._window_mismatch = False
-        self._hwnd_watch_active = True
-        self._start_daemon_thread(self._watch_hwnd, "hwnd-watch")
+        self._hwnd_watch_stop.clear()
+        if self._fg_watcher.installed:
+            # The hook only reports future changes; catch one that already happened.
+            self._on_foreground_changed()
+        else:
+            if self._hwnd_poll_thread is None:
+                self._hwnd_poll_thread = threading.Thread(
+                    target=self._hwnd_poll_worker,
+                    name="untype-hwnd-watch",
+                    daemon=True,
+                )
+                self._hwnd_poll_thread.start()
+            self._hwnd_poll_wake.set()
+
+    def _on_foreground_changed(self) -> None:
+        """Foreground window changed (called from the hook thread)."""
+        if self._hwnd_watch_stop.is_set():
+            return
+        try:
+            if self._check_foreground_mismatch():
+                self._hwnd_watch_stop.set()
+        except Exception:
+            logger.exception("Foreground check failed")
+            self._hwnd_watch_stop.set()
+            self._window_mismatch = True
+            try:
+                self._overlay.fly_to_corner()
+            except Exception:
+                logger.exception("Failed to fly capsule to corner during HWND watcher error")
+
+    def _check_foreground_mismatch(self) -> bool:
+        """Fly the capsule to the corner if the target lost the foreground.
+
+        Returns ``True`` when a mismatch was detected.
+        """
+        target = self._target_window
+        if target is None or verify_foreground_window(target):
+            return False
+        self._window_mismatch = True
+        self._overlay.fly_to_corner()
+        logger.info(
+            "Window switch detected during pipeline (expected HWND=%d, title=%r)",
+            target.hwnd,
+            target.title,
+        )
+        return True
+
+    def _hwnd_poll_worker(self) -> None:
+        """Sleep until a pipeline starts watching, then poll; forever."""
+        while True:
+            self._hwnd_poll_wake.wait()
+            self._hwnd_poll_wake.clear()
+            self._watch_hwnd()
 
     def _watch_hwnd(self) -> None:
         """Poll foreground window every 200ms.  Triggers capsule flight on mismatch."""
         try:
-            while self._hwnd_watch_active:
-                time.sleep(0.2)
-                if not self._hwnd_watch_active:
-                    break
-                if self._target_window is not None and not verify_foreground_window(
-                    self._target_window
-                ):
-                    self._window_mismatch = True
-                    logger.info(
-                        "Window switch detected during pipeline (expected HWND=%d, title=%r)",
-                        self._target_window.hwnd,
-                        self._target_window.title,
-                    )
-                    self._overlay.fly_to_corner()
+            while not self._hwnd_watch_stop.wait(0.2):
+                if self._check_foreground_mismatch():
                     break
         except Exception:
             # Log any unexpected error and exit cleanly rather than hanging
-            logger.exception("HWND watcher thread encountered an error")
+            logger.exception("HWND watcher encountered an error")
             self._window_mismatch = True
             try:
                 self._overlay.fly_to_corner()
             except Exception:
                 logger.exception("Failed to fly capsule to corner during HWND watcher error")
         finally:
-            # Ensure flag is cleared even if we exited abnormally
-            self._hwnd_watch_active = False
+            # Ensure the watch is marked stopped even if we exited abnormally
+            self._hwnd_watch_stop.set()
 
     def _verify_window_safety(self) -> bool:
         """Check if the target window is still safe for text injection.
@@ -940,12 +1090,15 @@ class UnTypeApp:
         inject_text(result, clipboard)
 
         # Show ghost menu if we have saved interaction state.
-        if self._last_raw_text is not None:
-            self._last_result = result
+        if self._last_state is not None:
             caret = get_caret_screen_position()
-            self._last_caret_x = caret.x
-            self._last_caret_y = caret.y
-            self._last_target_window = get_foreground_window()
+            self._last_state = replace(
+                self._last_state,
+                result=result,
+                target_window=get_foreground_window(),
+                caret_x=caret.x,
+                caret_y=caret.y,
+            )
             self._overlay.show_ghost_menu(caret.x, caret.y)
 
     def _on_hold_copy(self) -> None:
@@ -958,21 +1111,18 @@ class UnTypeApp:
             return
 
         logger.info("Hold-copy: copying %d chars to clipboard", len(result))
-        try:
-            pyperclip.copy(result)
-        except Exception:
-            logger.exception("Failed to copy held result to clipboard")
+        copy_text(result)
 
     def _on_hold_ghost(self) -> None:
         """Middle-click on hold bubble — show ghost menu for revert/regenerate.
 
         Does NOT inject text.  The held result is discarded (the ghost
-        menu actions will use ``_last_*`` state instead).
+        menu actions will use ``_last_state`` instead).
         """
         self._held_result = None
         self._held_clipboard = None
 
-        if self._last_raw_text is None:
+        if self._last_state is None:
             logger.warning("Hold-ghost: no interaction state saved")
             return
 
@@ -997,81 +1147,69 @@ class UnTypeApp:
         near the caret.  Set to False when diverting to the hold bubble
         (ghost will be shown after hold-inject instead).
         """
-        self._last_raw_text = raw_text
-        self._last_result = result
-        self._last_persona = persona
-        self._last_mode = self._mode
-        self._last_selected_text = self._selected_text
-        self._last_original_clipboard = self._original_clipboard
-        self._last_target_window = self._target_window
-
         caret = get_caret_screen_position()
-        self._last_caret_x = caret.x
-        self._last_caret_y = caret.y
+        self._last_state = _InteractionState(
+            raw_text=raw_text,
+            result=result,
+            persona=persona,
+            mode=self._mode,
+            selected_text=self._selected_text,
+            original_clipboard=self._original_clipboard,
+            target_window=self._target_window,
+            caret_x=caret.x,
+            caret_y=caret.y,
+        )
 
         if show_ghost:
             self._overlay.show_ghost_menu(caret.x, caret.y)
 
-    def _simulate_undo(self) -> None:
-        """Send Ctrl+Z to undo the last paste in the target app."""
-        from pynput.keyboard import Controller, Key
-
-        kbd = Controller()
-        release_all_modifiers()
-        time.sleep(0.05)
-        kbd.press(Key.ctrl_l)
-        time.sleep(0.05)
-        kbd.press("z")
-        time.sleep(0.02)
-        kbd.release("z")
-        time.sleep(0.02)
-        kbd.release(Key.ctrl_l)
-        time.sleep(0.1)
+    def _restore_interaction_state(self, state: _InteractionState) -> None:
+        """Make *state* the current interaction context again."""
+        self._mode = state.mode
+        self._selected_text = state.selected_text
+        self._original_clipboard = state.original_clipboard
+        self._target_window = state.target_window
+        self._caret_x = state.caret_x
+        self._caret_y = state.caret_y
 
     def _on_ghost_revert(self) -> None:
         """Ghost menu 'Revert' — undo paste, reopen staging with raw text."""
-        raw_text = self._last_raw_text
-        if raw_text is None:
+        last = self._last_state
+        if last is None:
             logger.warning("Ghost revert: no interaction state saved")
             return
+        raw_text = last.raw_text
 
         if not self._pipeline_lock.acquire(blocking=False):
             logger.warning("Ghost revert: pipeline busy — ignoring")
             return
+        self._interaction_gen += 1
+        # A cancel pressed while idle must not abort this new action.
+        self._cancel_requested.clear()
 
         try:
             # Undo the paste if the target window is still in foreground.
-            target = self._last_target_window
+            target = last.target_window
             if target is not None and verify_foreground_window(target):
                 logger.info("Ghost revert: undoing paste via Ctrl+Z")
-                self._simulate_undo()
+                simulate_undo()
             else:
                 logger.info("Ghost revert: target window not in foreground, skipping undo")
 
             # Restore interaction context for the staging area.
-            self._mode = self._last_mode or "insert"
-            self._selected_text = self._last_selected_text
-            self._original_clipboard = self._last_original_clipboard
-            self._target_window = target
-            self._caret_x = self._last_caret_x
-            self._caret_y = self._last_caret_y
+            self._restore_interaction_state(last)
             self._window_mismatch = False
 
-            # Build persona list for staging (if available).
-            personas_arg = None
-            if self._active_personas:
-                personas_arg = [(p.id, p.icon, p.name) for p in self._active_personas]
-
             # Clear last state before re-entering staging.
-            self._last_raw_text = None
-            self._last_result = None
+            self._last_state = None
 
             # Show staging area with the raw text.
             self._overlay.show_staging(
                 raw_text,
                 self._caret_x,
                 self._caret_y,
-                personas=personas_arg,
+                # Precomputed by _set_personas; None hides the persona bar.
+                personas=self._active_persona_tuples or None,
             )
 
             # Block until user acts.
@@ -1086,10 +1224,7 @@ class UnTypeApp:
             persona = None
             if action.startswith("persona:"):
                 pid = action.split(":", 1)[1]
-                persona = next(
-                    (p for p in self._personas if p.id == pid),
-                    None,
-                )
+                persona = self._personas_by_id.get(pid)
                 action = "refine"
 
             if action == "raw":
@@ -1099,157 +1234,84 @@ class UnTypeApp:
                 return
 
             # action == "refine"
-            self._overlay.show(self._caret_x, self._caret_y, "Processing...")
-            self._tray.update_status("Processing...")
-
-            # Start HWND monitoring during LLM call.
-            self._start_hwnd_watcher()
-
-            try:
-                result = self._run_llm(edited_text, persona=persona)
-            except KeyboardInterrupt:
-                # LLM request was cancelled by user
-                logger.info("Ghost revert: LLM cancelled by user")
-                self._hwnd_watch_active = False
-                self._overlay.hide()
-                self._tray.update_status("Ready")
-                return
-
-            # Stop watcher and verify window before injection.
-            self._hwnd_watch_active = False
-            if not self._verify_window_safety():
-                logger.warning(
-                    "Ghost revert: window changed during LLM — holding result",
-                )
-                self._save_interaction_state(
-                    raw_text,
-                    result,
-                    persona=persona,
-                    show_ghost=False,
-                )
-                self._held_result = result
-                self._held_clipboard = self._original_clipboard
-                self._overlay.fly_to_hold_bubble(result)
-                self._tray.update_status("Ready")
-                return
-
-            logger.info("Ghost revert: injecting refined text (%d chars)", len(result))
-            inject_text(result, self._original_clipboard)
-            self._save_interaction_state(raw_text, result, persona=persona)
-            self._overlay.hide()
-            self._tray.update_status("Ready")
+            self._refine_and_inject(raw_text, edited_text, persona, context="Ghost revert")
 
         except Exception:
             logger.exception("Ghost revert error")
-            self._hwnd_watch_active = False
+            self._hwnd_watch_stop.set()
             self._overlay.hide()
-            self._tray.update_status("Ready")
+            self._tray.update_status(_STATUS_READY)
         finally:
-            self._hwnd_watch_active = False
+            self._hwnd_watch_stop.set()
             self._pipeline_lock.release()
 
     def _on_ghost_regenerate(self) -> None:
         """Ghost menu 'Regenerate' — undo paste, re-run LLM, inject new result."""
-        raw_text = self._last_raw_text
-        persona = self._last_persona
-        if raw_text is None:
+        last = self._last_state
+        if last is None:
             logger.warning("Ghost regenerate: no interaction state saved")
             return
+        raw_text = last.raw_text
+        persona = last.persona
 
         if not self._pipeline_lock.acquire(blocking=False):
             logger.warning("Ghost regenerate: pipeline busy — ignoring")
             return
+        self._interaction_gen += 1
+        # A cancel pressed while idle must not abort this new action.
+        self._cancel_requested.clear()
 
         try:
             # Undo the paste if the target window is still in foreground.
-            target = self._last_target_window
+            target = last.target_window
             if target is not None and verify_foreground_window(target):
                 logger.info("Ghost regenerate: undoing paste via Ctrl+Z")
-                self._simulate_undo()
+                simulate_undo()
             else:
                 logger.info("Ghost regenerate: target window not in foreground, skipping undo")
 
             # Restore interaction context.
-            self._mode = self._last_mode or "insert"
-            self._selected_text = self._last_selected_text
-            self._original_clipboard = self._last_original_clipboard
-            self._target_window = target
-            self._caret_x = self._last_caret_x
-            self._caret_y = self._last_caret_y
+            self._restore_interaction_state(last)
             self._window_mismatch = False
 
-            # Show capsule with processing status.
-            self._overlay.show(self._caret_x, self._caret_y, "Processing...")
-            self._tray.update_status("Processing...")
-
-            # Start HWND monitoring during LLM call.
-            self._start_hwnd_watcher()
-
-            try:
-                result = self._run_llm(raw_text, persona=persona)
-            except KeyboardInterrupt:
-                # LLM request was cancelled by user
-                logger.info("Ghost regenerate: LLM cancelled by user")
-                self._hwnd_watch_active = False
-                self._overlay.hide()
-                self._tray.update_status("Ready")
-                return
-
-            # Stop watcher and verify window before injection.
-            self._hwnd_watch_active = False
-            if not self._verify_window_safety():
-                logger.warning(
-                    "Ghost regenerate: window changed during LLM — holding result",
-                )
-                self._save_interaction_state(
-                    raw_text,
-                    result,
-                    persona=persona,
-                    show_ghost=False,
-                )
-                self._held_result = result
-                self._held_clipboard = self._original_clipboard
-                self._overlay.fly_to_hold_bubble(result)
-                self._tray.update_status("Ready")
-                return
-
-            logger.info("Ghost regenerate: injecting refined text (%d chars)", len(result))
-            inject_text(result, self._original_clipboard)
-            self._save_interaction_state(raw_text, result, persona=persona)
-            self._overlay.hide()
-            self._tray.update_status("Ready")
+            # Regenerating must produce a fresh response, not a cache hit.
+            self._refine_and_inject(
+                raw_text, raw_text, persona, context="Ghost regenerate", use_cache=False
+            )
 
         except Exception:
             logger.exception("Ghost regenerate error")
-            self._hwnd_watch_active = False
+            self._hwnd_watch_stop.set()
             self._overlay.hide()
-            self._tray.update_status("Ready")
+            self._tray.update_status(_STATUS_READY)
         finally:
-            self._hwnd_watch_active = False
+            self._hwnd_watch_stop.set()
             self._pipeline_lock.release()
 
     def _on_ghost_use_raw(self) -> None:
         """Ghost menu 'Use Raw' — undo paste, inject raw STT text instead."""
-        raw_text = self._last_raw_text
-        if raw_text is None:
+        last = self._last_state
+        if last is None:
             logger.warning("Ghost use-raw: no interaction state saved")
             return
+        raw_text = last.raw_text
 
         if not self._pipeline_lock.acquire(blocking=False):
             logger.warning("Ghost use-raw: pipeline busy — ignoring")
             return
+        self._interaction_gen += 1
 
         try:
             # Undo the paste if the target window is still in foreground.
-            target = self._last_target_window
+            target = last.target_window
             if target is not None and verify_foreground_window(target):
                 logger.info("Ghost use-raw: undoing paste via Ctrl+Z")
-                self._simulate_undo()
+                simulate_undo()
             else:
                 logger.info("Ghost use-raw: target window not in foreground, skipping undo")
 
             # Restore context.
-            self._original_clipboard = self._last_original_clipboard
+            self._original_clipboard = last.original_clipboard
             self._target_window = target
 
             logger.info("Ghost use-raw: injecting raw text (%d chars)", len(raw_text))
@@ -1282,20 +1344,29 @@ class UnTypeApp:
 
     def _save_selected_persona(self, persona_id: str | None) -> None:
         """Save the selected persona ID to config."""
-        from untype.config import save_config
-
         # Save "default" as empty string (the actual default)
         if persona_id == "default":
             persona_id = None
 
         self._config.last_selected_persona = persona_id or "default"
-        # Spawn a thread to save config without blocking
-        threading.Thread(
-            target=save_config,
-            args=(self._config,),
-            name="untype-save-persona",
-            daemon=True,
-        ).start()
+        self._schedule_config_save()
+
+    def _schedule_config_save(self) -> None:
+        """Save the config once changes stop arriving for a moment."""
+        # Restart the debounce timer; the save runs once changes stop.
+        with self._config_save_lock:
+            if self._config_save_timer is not None:
+                self._config_save_timer.cancel()
+            timer = threading.Timer(_CONFIG_SAVE_DELAY, self._flush_config_save)
+            timer.daemon = True
+            self._config_save_timer = timer
+            timer.start()
+
+    def _flush_config_save(self) -> None:
+        """Debounce timer fired: hand the save to the config-save worker."""
+        with self._config_save_lock:
+            self._config_save_timer = None
+        self._config_save_q.put(lambda: save_config(self._config))
 
     def _on_rec_persona_click(self, index: int) -> None:
         """Called from overlay thread when a recording persona button is clicked."""
@@ -1309,7 +1380,7 @@ class UnTypeApp:
         """Handle settings changes pushed from the tray settings dialog."""
         old = self._prev_config
         self._config = new_config
-        self._prev_config = copy.deepcopy(new_config)
+        self._prev_config = copy_config(new_config)
 
         logger.info("Saving updated configuration...")
         save_config(new_config)
@@ -1347,6 +1418,7 @@ class UnTypeApp:
             or new_config.audio.device != old.audio.device
         ):
             logger.info("Audio settings changed — reinitialising recorder")
+            self._recorder.close()
             self._recorder = self._init_recorder()
 
         # --- STT engine ---
@@ -1363,25 +1435,38 @@ class UnTypeApp:
             logger.info("STT settings changed — reinitialising engine...")
             old_stt = self._stt
             self._stt = self._init_stt()
-            # Clean up old STT engine (all engines have close() method)
-            if hasattr(old_stt, "close"):
-                old_stt.close()
+            self._bind_audio_chunk_sink()
+            # Clean up old STT engine (every engine implements close())
+            old_stt.close()
 
         # --- LLM client ---
-        llm_changed = (
+        llm_transport_changed = (
             new_config.llm.base_url != old.llm.base_url
             or new_config.llm.api_key != old.llm.api_key
             or new_config.llm.model != old.llm.model
-            or new_config.llm.temperature != old.llm.temperature
+        )
+        llm_settings_changed = (
+            new_config.llm.temperature != old.llm.temperature
             or new_config.llm.max_tokens != old.llm.max_tokens
             or new_config.llm.prompts.polish != old.llm.prompts.polish
             or new_config.llm.prompts.insert != old.llm.prompts.insert
         )
-        if llm_changed:
+        if llm_transport_changed:
             logger.info("LLM settings changed — reinitialising client")
             if self._llm is not None:
                 self._llm.close()
             self._llm = self._init_llm_client()
+        elif llm_settings_changed and self._llm is not None:
+            # Prompts and sampling defaults don't need a new connection.
+            logger.info("LLM prompts/sampling changed — updating client in place")
+            self._llm.update_settings(
+                temperature=new_config.llm.temperature,
+                max_tokens=new_config.llm.max_tokens,
+                prompts={
+                    "polish": new_config.llm.prompts.polish,
+                    "insert": new_config.llm.prompts.insert,
+                },
+            )
 
         # --- Overlay capsule position mode ---
         if new_config.overlay.capsule_position_mode != old.overlay.capsule_position_mode:
@@ -1393,14 +1478,14 @@ class UnTypeApp:
             self._overlay.set_capsule_position_mode(new_config.overlay.capsule_position_mode)
 
         # --- Personas ---
-        self._personas = load_personas()
+        self._set_personas(load_personas())
         logger.info("Reloaded %d persona(s)", len(self._personas))
 
         logger.info("Settings update complete")
 
     def _on_personas_changed(self) -> None:
         """Handle persona changes pushed from the persona manager dialog."""
-        self._personas = load_personas()
+        self._set_personas(load_personas())
         logger.info("Reloaded %d persona(s) from persona manager", len(self._personas))
 
     def _on_rerun_wizard(self) -> None:
@@ -1415,16 +1500,8 @@ class UnTypeApp:
 
             def on_wizard_complete(updated_config: AppConfig) -> None:
                 logger.info("Setup wizard completed, configuration updated")
-                # Reload configuration
-                self._config = updated_config
-                self._prev_config = copy.deepcopy(updated_config)
-                # Reinitialize components that depend on config
-                self._hotkey.stop()
-                self._hotkey = HotkeyListener(
-                    self._config.hotkey.trigger, self._config.hotkey.mode, self._on_hotkey_press
-                )
-                self._hotkey.start()
-                logger.info("Hotkey listener restarted")
+                # Same path as the settings dialog: only what changed is reinitialised.
+                self._on_settings_changed(updated_config)
 
             # Run wizard (blocking call)
             run_setup_wizard(config, on_wizard_complete)
@@ -1433,14 +1510,14 @@ class UnTypeApp:
 
     def _on_capsule_position_changed(self, x: int, y: int) -> None:
         """Handle capsule position change from drag (fixed mode)."""
-        self._config.overlay.capsule_fixed_x = x
-        self._config.overlay.capsule_fixed_y = y
-        # Save to config file
-        try:
-            save_config(self._config)
-            logger.debug("Saved capsule position: %d, %d", x, y)
-        except Exception:
-            logger.exception("Failed to save capsule position")
+        overlay_cfg = self._config.overlay
+        if (overlay_cfg.capsule_fixed_x, overlay_cfg.capsule_fixed_y) == (x, y):
+            return
+        overlay_cfg.capsule_fixed_x = x
+        overlay_cfg.capsule_fixed_y = y
+        # Written off the overlay thread, coalesced with other quick changes.
+        self._schedule_config_save()
+        logger.debug("Capsule position changed: %d, %d", x, y)
 
     # ------------------------------------------------------------------
     # Quit
@@ -1449,13 +1526,25 @@ class UnTypeApp:
     def _on_quit(self) -> None:
         """Handle the Quit action from the tray menu."""
         logger.info("Shutting down...")
+        # Write a persona selection still waiting on the debounce timer.
+        with self._config_save_lock:
+            timer = self._config_save_timer
+            self._config_save_timer = None
+        if timer is not None:
+            timer.cancel()
+            try:
+                save_config(self._config)
+            except Exception:
+                logger.exception("Failed to save persona selection on exit")
         self._hotkey.stop()
         self._digit_interceptor.stop()
+        self._fg_watcher.stop()
         self._overlay.stop()
+        self._recorder.close()
         if self._llm is not None:
             self._llm.close()
-        if isinstance(self._stt, (STTApiEngine, STTRealtimeApiEngine)):
-            self._stt.close()
+        self._stt.close()
+        self._bg_executor.shutdown(wait=False, cancel_futures=True)
         self._tray.stop()
         logger.info("Goodbye.")
 
@@ -1464,39 +1553,40 @@ class UnTypeApp:
     # ------------------------------------------------------------------
 
     def _init_recorder(self) -> AudioRecorder:
-        """Create an AudioRecorder from the current config."""
+        """Create an AudioRecorder from the current config and size its scratch buffer."""
         device = self._config.audio.device or None  # "" -> None (system default)
-        return AudioRecorder(
+        recorder = AudioRecorder(
             sample_rate=self._config.audio.sample_rate,
             device=device,
             on_volume=self._on_audio_volume,
             on_audio_chunk=self._on_audio_chunk,
         )
+        # Reused for every recording: the pipeline lock guarantees only one
+        # pipeline reads it at a time, so stop() + the STT gain stage never
+        # allocate per press.
+        self._audio_scratch = np.empty(recorder.capacity, dtype=np.float32)
+        return recorder
 
     def _start_timeout_monitor(self) -> None:
-        """Start a background thread to monitor recording duration and enforce timeout."""
-        # Stop any existing timer
-        self._stop_timeout_timer.set()
-
-        # Reset the stop event for the new timer
+        """Start monitoring recording duration and enforcing the timeout."""
         self._stop_timeout_timer.clear()
-
-        # Start a new timer thread
-        self._timeout_timer = threading.Thread(
-            target=self._timeout_monitor_loop,
-            name="untype-timeout-monitor",
-            daemon=True,
-        )
-        self._timeout_timer.start()
+        self._timeout_wake.set()
 
     def _stop_timeout_monitor(self) -> None:
-        """Stop the timeout monitor thread."""
+        """Stop monitoring the current recording."""
         self._stop_timeout_timer.set()
 
+    def _timeout_monitor_worker(self) -> None:
+        """Sleep until a recording starts, then monitor it; forever."""
+        while True:
+            self._timeout_wake.wait()
+            self._timeout_wake.clear()
+            self._timeout_monitor_loop()
+
     def _timeout_monitor_loop(self) -> None:
-        """Background loop that monitors recording duration and enforces timeout.
+        """Monitor the current recording's duration and enforce the timeout.
 
-        Runs every second while recording is active:
+        Wakes as each whole second of the recording elapses:
         - Updates duration display on capsule
         - Shows warning when approaching timeout
         - Auto-stops recording when max duration is reached
@@ -1506,7 +1596,8 @@ class UnTypeApp:
         MAX_SECONDS = AudioRecorder.MAX_RECORDING_SECONDS  # 5 minutes
         WARNING_SECONDS = 30  # Show warning 30 seconds before timeout
 
-        while not self._stop_timeout_timer.is_set():
+        while True:
+            wait = 1.0
             if self._recorder.is_recording:
                 duration = self._recorder.get_duration()
                 remaining = MAX_SECONDS - duration
@@ -1533,8 +1624,12 @@ class UnTypeApp:
                     self._on_cancel()
                     break
 
-            # Check every second
-            self._stop_timeout_timer.wait(timeout=1.0)
+                # Sleep until just past the next whole second (or the deadline),
+                # rather than a fixed second that drifts by the work done above.
+                wait = min(1.0 - duration % 1.0, remaining) + 0.01
+
+            if self._stop_timeout_timer.wait(timeout=wait):
+                break
 
     def _on_audio_volume(self, level: float) -> None:
         """Handle audio volume update from the recorder (called from audio thread)."""
@@ -1542,16 +1637,23 @@ class UnTypeApp:
 
     def _on_audio_chunk(self, chunk: np.ndarray) -> None:
         """Handle audio chunk during recording for realtime STT (called from audio thread)."""
-        if self._config.stt.backend == "realtime_api":
-            if isinstance(self._stt, STTRealtimeApiEngine):
-                self._stt.on_audio_chunk(chunk)
+        sink = self._audio_chunk_sink
+        if sink is not None:
+            sink(chunk)
+
+    def _bind_audio_chunk_sink(self) -> None:
+        """Route audio chunks to the current STT engine if it streams."""
+        stt = self._stt
+        self._audio_chunk_sink = (
+            stt.on_audio_chunk if isinstance(stt, STTRealtimeApiEngine) else None
+        )
 
     def _on_realtime_text_update(self, text: str) -> None:
         """Handle realtime text update from streaming STT (called from STT thread).
 
         Updates the live transcription preview on the overlay during recording.
         """
-        logger.debug("Realtime text update: %s", text)
+        # Not logged here: the engine already logs every partial at DEBUG.
         self._overlay.update_realtime_preview(text)
 
     def _handle_stt_config_check(self) -> None:
@@ -1587,40 +1689,54 @@ class UnTypeApp:
         import tkinter.messagebox as messagebox
         import tkinter as tk
 
+        # One hidden root (one Tcl interpreter) serves the prompts and the
+        # progress window.
         root = tk.Tk()
         root.withdraw()
+        try:
+            # Check network first
+            has_network = self._check_network_connectivity()
+
+            if not has_network:
+                messagebox.showerror(
+                    "无法连接网络",
+                    f"本地模型 '{model_size}' 不存在，需要从网络下载。\n\n"
+                    "但当前无法连接到 HuggingFace，请检查网络环境后重试。",
+                    parent=root,
+                )
+                return
 
-        # Check network first
-        has_network = self._check_network_connectivity()
-
-        if not has_network:
-            messagebox.showerror(
-                "无法连接网络",
-                f"本地模型 '{model_size}' 不存在，需要从网络下载。\n\n"
-                "但当前无法连接到 HuggingFace，请检查网络环境后重试。"
+            # Network OK, ask user to confirm download
+            result = messagebox.askyesno(
+                "下载本地模型",
+                f"本地模型 '{model_size}' 不存在，需要从网络下载（约 500MB）。\n\n"
+                "请确保网络已连接，点击「是」开始下载。\n\n"
+                "下载可能需要几分钟时间，请耐心等待。",
+                parent=root,
             )
-            root.destroy()
-            return
 
-        # Network OK, ask user to confirm download
-        result = messagebox.askyesno(
-            "下载本地模型",
-            f"本地模型 '{model_size}' 不存在，需要从网络下载（约 500MB）。\n\n"
-            "请确保网络已连接，点击「是」开始下载。\n\n"
-            "下载可能需要几分钟时间，请耐心等待。"
-        )
-        root.destroy()
+            if result:
+                self._download_whisper_model(root, model_size)
+        finally:
+            root.destroy()
 
-        if result:
-            self._download_whisper_model(model_size)
+    def _download_whisper_model(self, root, model_size: str) -> None:
+        """Download the Whisper model and show progress.
 
-    def _download_whisper_model(self, model_size: str) -> None:
-        """Download the Whisper model and show progress."""
+        The progress window is a child of *root*; this runs *root*'s
+        mainloop until the window is closed.
+        """
         import tkinter as tk
+        import tkinter.messagebox as messagebox
         from tkinter import ttk
 
         # Create progress window
-        progress_root = tk.Tk()
+        progress_root = tk.Toplevel(root)
+        # However the window goes away (done, failed, or closed by the user),
+        # hand control back to the caller.
+        progress_root.bind(
+            "<Destroy>", lambda e: root.quit() if e.widget is progress_root else None
+        )
         progress_root.title("下载模型")
         progress_root.geometry("400x150")
         progress_root.resizable(False, False)
@@ -1686,7 +1802,8 @@ class UnTypeApp:
                     0,
                     lambda: messagebox.showerror(
                         "下载失败",
-                        f"模型下载失败：{e}\n\n请检查网络连接后重试。"
+                        f"模型下载失败：{e}\n\n请检查网络连接后重试。",
+                        parent=progress_root,
                     )
                 )
                 progress_root.after(0, lambda: progress_root.destroy())
@@ -1696,7 +1813,7 @@ class UnTypeApp:
         thread = threading.Thread(target=download_thread, daemon=True)
         thread.start()
 
-        progress_root.mainloop()
+        root.mainloop()
 
     def _handle_missing_api_config(self, missing_items: list[str]) -> None:
         """Handle the case when API configuration is missing."""
@@ -1720,33 +1837,21 @@ class UnTypeApp:
     def _check_local_model_exists(self, model_size: str) -> bool:
         """Check if the local Whisper model already exists."""
         try:
-            from faster_whisper import WhisperModel
-            # Try to load the model without downloading
-            # This will raise an error if the model doesn't exist locally
-            import os
-            # Check common cache locations
-            cache_dir = os.path.expanduser("~/.cache/huggingface/hub")
-            if not os.path.exists(cache_dir):
-                return False
-
-            # Look for model folder in cache
-            model_name = f"Systran/faster-whisper-{model_size}"
-            for item in os.listdir(cache_dir):
-                if model_name.replace("-", "_").replace("/", "--") in item or model_name in item:
-                    return True
-            return False
+            # A cached model is useless without faster-whisper itself.
+            from faster_whisper import WhisperModel  # noqa: F401
+            return STTEngine.is_model_cached(model_size)
         except Exception:
             return False
 
     def _check_network_connectivity(self, timeout: float = 3.0) -> bool:
         """Check if network connectivity to HuggingFace is available."""
+        # Reachability only: a TCP connect to 443 skips the TLS handshake and
+        # HTTP round-trip, and leaves the process-wide socket timeout alone.
         try:
-            import urllib.request
             import socket
-            socket.setdefaulttimeout(timeout)
-            urllib.request.urlopen("https://huggingface.co", timeout=timeout)
-            return True
-        except Exception:
+            with socket.create_connection(("huggingface.co", 443), timeout=timeout):
+                return True
+        except OSError:
             return False
 
     def _validate_api_endpoint(self, base_url: str, api_key: str) -> bool:
@@ -1883,13 +1988,23 @@ def main() -> None:
     # Setup logging
     _setup_logging()
 
+    # Loaded once and shared by the wizard and the app.
+    logger.info("Loading configuration...")
+    config = load_config()
+
     # Check if first run and show setup wizard
+    setup_completed = False
     if is_first_run():
         logger.info("First run detected, launching setup wizard...")
-        _run_first_run_wizard()
+        setup_completed = _run_first_run_wizard(config)
 
-    app = UnTypeApp()
-    app.run()
+    app = UnTypeApp(config)
+    try:
+        app.run(setup_completed=setup_completed)
+    finally:
+        # Flush queued log records before the process exits.
+        if _log_listener is not None:
+            _log_listener.stop()
 
 
 def is_first_run() -> bool:
@@ -1898,111 +2013,27 @@ def is_first_run() -> bool:
     return _is_first_run()
 
 
-def _run_first_run_wizard() -> None:
-    """Run the first-run setup wizard."""
+def _run_first_run_wizard(config: AppConfig) -> bool:
+    """Run the first-run setup wizard.
+
+    The wizard applies its settings to *config* in place (and saves them).
+    Returns ``True`` if the user completed it.
+    """
     from untype.wizard import run_setup_wizard
-    from untype.config import load_config
 
-    config = load_config()
+    completed = False
 
     def on_wizard_complete(updated_config: AppConfig) -> None:
+        nonlocal completed
         logger.info("Setup wizard completed, configuration updated")
-        _show_tray_notification()
+        completed = True
 
     run_setup_wizard(config, on_wizard_complete)
+    return completed
 
 
-def _show_tray_notification() -> None:
-    """Show a bubble notification near the system tray after wizard completion."""
-    import threading
-
-    def _show_notification() -> None:
-        try:
-            import tkinter as tk
-            import time
-
-            # Wait for wizard to fully close and main app to start
-            time.sleep(1.5)
-
-            # Create notification window
-            notif = tk.Tk()
-            notif.configure(bg="#2d2d2d")
-            notif.withdraw()
-            notif.attributes("-topmost", True)
-            notif.attributes("-toolwindow", True)
-            notif.overrideredirect(True)
-
-            # Dark theme colors
-            bg_color = "#2d2d2d"
-            fg_color = "#e0e0e0"
-            accent_color = "#4CAF50"
-
-            # Main frame
-            main = tk.Frame(notif, bg=bg_color, relief="solid", borderwidth=1)
-            main.pack(padx=0, pady=0)
-
-            # Content
-            content = tk.Frame(main, bg=bg_color)
-            content.pack(fill="both", expand=True, padx=20, pady=15)
-
-            # Icon and title
-            top = tk.Frame(content, bg=bg_color)
-            top.pack(fill="x", pady=(0, 10))
-
-            tk.Label(
-                top,
-                text="✅ 配置完成！",
-                font=("Microsoft YaHei UI", 11, "bold"),
-                bg=bg_color,
-                fg=fg_color,
-            ).pack()
-
-            tk.Label(
-                content,
-                text="我在右下角状态栏 👇",
-                font=("Microsoft YaHei UI", 9),
-                bg=bg_color,
-                fg="#b0bec5",
-            ).pack(pady=(0, 5))
-
-            tk.Label(
-                content,
-                text="按 F6 开始使用",
-                font=("Microsoft YaHei UI", 9),
-                bg=bg_color,
-                fg=accent_color,
-            ).pack()
-
-            # Position at bottom right
-            notif.update_idletasks()
-            screen_w = notif.winfo_screenwidth()
-            screen_h = notif.winfo_screenheight()
-
-            notif_width = 220
-            notif_height = 110
-
-            x = screen_w - notif_width - 15
-            y = screen_h - notif_height - 50
-
-            notif.geometry(f"{notif_width}x{notif_height}+{x}+{y}")
-            notif.deiconify()
-
-            # Auto-dismiss with cleanup
-            def close_notif():
-                try:
-                    notif.destroy()
-                except Exception:
-                    pass
-
-            notif.after(5000, close_notif)
-            notif.mainloop()
-
-        except Exception as e:
-            logger.warning("Failed to show tray notification: %s", e)
-
-    # Run in daemon thread so it doesn't block the main app
-    thread = threading.Thread(target=_show_notification, daemon=True)
-    thread.start()
+# Writes queued log records to the real handlers; see _setup_logging().
+_log_listener: logging.handlers.QueueListener | None = None
 
 
 def _setup_logging() -> None:
@@ -2018,11 +2049,17 @@ def _setup_logging() -> None:
     log_format = "%(asctime)s [%(name)s] %(levelname)s: %(message)s"
     date_format = "%Y-%m-%d %H:%M:%S"
 
-    # Root logger configuration
+    # Root logger configuration.  INFO here means DEBUG calls (several fire
+    # per audio chunk or STT partial) are rejected before a record is built;
+    # lower it to get the file handler's DEBUG output.
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.INFO)
 
     # Remove any existing handlers to avoid duplicates
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
     root_logger.handlers.clear()
 
     # Console handler (with colored output for Windows)
@@ -2030,7 +2067,6 @@ def _setup_logging() -> None:
     console_handler.setLevel(logging.INFO)
     console_formatter = logging.Formatter(log_format, datefmt=date_format)
     console_handler.setFormatter(console_formatter)
-    root_logger.addHandler(console_handler)
 
     # File handler with rotation
     # Keep 3 backup files, max 500KB each = ~2MB total
@@ -2041,10 +2077,18 @@ def _setup_logging() -> None:
         backupCount=3,  # Keep 3 backup files
         encoding="utf-8",
     )
-    file_handler.setLevel(logging.DEBUG)  # File gets more detailed logs
+    file_handler.setLevel(logging.DEBUG)  # File gets DEBUG when the root allows it
     file_formatter = logging.Formatter(log_format, datefmt=date_format)
     file_handler.setFormatter(file_formatter)
-    root_logger.addHandler(file_handler)
+
+    # Callers (including the audio and STT threads) only enqueue records;
+    # a listener thread does the console/file writes and log rotation.
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    _log_listener.start()
 
     logging.info("UnType starting...")
     logging.info("Log file: %s", log_file)
@@ -12,7 +12,7 @@ import math
 import queue
 import threading
 import tkinter as tk
-from typing import Callable
+from typing import Callable, Sequence
 
 from untype.i18n import t
 from untype.platform import set_window_noactivate
@@ -86,8 +86,8 @@ def _apply_noactivate(win: tk.Toplevel | tk.Tk, context: str = "") -> None:
         set_window_noactivate(win)
     except Exception:
         logger.debug(
-            f"set_window_noactivate failed{' on ' + context if context else ''} "
-            "— overlay may steal focus"
+            "set_window_noactivate failed%s — overlay may steal focus",
+            f" on {context}" if context else "",
         )
 
 
@@ -200,6 +200,11 @@ class CapsuleOverlay:
         # Realtime preview state
         self._realtime_preview_window: tk.Toplevel | None = None
         self._realtime_preview_label: tk.Label | None = None
+        # Latest preview text; only one update command is queued at a time,
+        # so a burst of partial results renders once per poll.
+        self._realtime_preview_text: str = ""
+        self._realtime_preview_update_queued: bool = False
+        self._realtime_preview_shown: str | None = None  # Text on the label
         self._realtime_preview_x: int = 0
         self._realtime_preview_y: int = 0
 
@@ -207,6 +212,10 @@ class CapsuleOverlay:
         self._cancel_btn_id: int | None = None
         self._cancel_hover: bool = False
         self._volume_bar_id: int | None = None
+        # Latest level from the audio thread; as with the preview text, only
+        # one VOLUME command is queued at a time.
+        self._volume_level: float = 0.0
+        self._volume_update_queued: bool = False
         self._volume_bg_id: int | None = None
 
         # Ghost menu state
@@ -251,6 +260,14 @@ class CapsuleOverlay:
         """Hide the capsule."""
         self._queue.put(("HIDE",))
 
+    def reset_to_ready(self, hide_preview: bool = True) -> None:
+        """Hide the recording persona bar, realtime preview and capsule.
+
+        Same as calling :meth:`hide_recording_personas`,
+        :meth:`hide_realtime_preview` and :meth:`hide`, as a single command.
+        """
+        self._queue.put(("RESET", hide_preview))
+
     def set_capsule_position_mode(self, mode: str) -> None:
         """Update the capsule position mode.
 
@@ -267,10 +284,16 @@ class CapsuleOverlay:
     def update_volume(self, level: float) -> None:
         """Update the volume indicator in the capsule.
 
+        Levels arriving faster than the overlay polls are coalesced; only
+        the most recent one is drawn.
+
         Args:
             level: Audio level from 0.0 to 1.0.
         """
-        self._queue.put(("VOLUME", level))
+        self._volume_level = level
+        if not self._volume_update_queued:
+            self._volume_update_queued = True
+            self._queue.put(("VOLUME",))
 
     def update_duration(self, duration_seconds: float, warning: bool = False) -> None:
         """Update the recording duration displayed on the capsule.
@@ -307,7 +330,7 @@ class CapsuleOverlay:
         x: int,
         y: int,
         at_corner: bool = False,
-        personas: list[tuple[str, str, str]] | None = None,
+        personas: Sequence[tuple[str, str, str]] | None = None,
     ) -> None:
         """Show the editable staging area with draft text.
 
@@ -341,7 +364,7 @@ class CapsuleOverlay:
 
     def show_recording_personas(
         self,
-        personas: list[tuple[str, str, str]],
+        personas: Sequence[tuple[str, str, str]],
         x: int,
         y: int,
         on_click: Callable[[int], None] | None = None,
@@ -383,10 +406,16 @@ class CapsuleOverlay:
     def update_realtime_preview(self, text: str) -> None:
         """Update the text shown in the realtime preview window.
 
+        Updates arriving faster than the overlay polls are coalesced; only
+        the most recent text is rendered.
+
         Args:
             text: The current accumulated transcription text.
         """
-        self._queue.put(("REALTIME_PREVIEW_UPDATE", text))
+        self._realtime_preview_text = text
+        if not self._realtime_preview_update_queued:
+            self._realtime_preview_update_queued = True
+            self._queue.put(("REALTIME_PREVIEW_UPDATE",))
 
     def hide_realtime_preview(self) -> None:
         """Hide the realtime preview window."""
@@ -437,6 +466,17 @@ class CapsuleOverlay:
         """Hide and destroy the ghost menu."""
         self._queue.put(("GHOST_HIDE",))
 
+    # ------------------------------------------------------------------
+    # Setup-complete notice (thread-safe public API)
+    # ------------------------------------------------------------------
+
+    def show_setup_complete_notice(self, delay_ms: int = 0) -> None:
+        """Show the "setup complete" toast near the tray after *delay_ms*.
+
+        The toast dismisses itself after a few seconds.
+        """
+        self._queue.put(("SETUP_NOTICE", delay_ms))
+
     # ------------------------------------------------------------------
     # Overlay thread internals
     # ------------------------------------------------------------------
@@ -686,6 +726,12 @@ class CapsuleOverlay:
             self._do_update_status(status)
         elif op == "HIDE":
             self._do_hide()
+        elif op == "RESET":
+            _, hide_preview = cmd
+            self._do_hide_recording_personas()
+            if hide_preview:
+                self._do_hide_realtime_preview()
+            self._do_hide()
         elif op == "HOLD_BUBBLE":
             _, text, x, y = cmd
             self._do_show_hold_bubble(text, x, y)
@@ -711,8 +757,7 @@ class CapsuleOverlay:
             _, x, y = cmd
             self._do_show_realtime_preview(x, y)
         elif op == "REALTIME_PREVIEW_UPDATE":
-            _, text = cmd
-            self._do_update_realtime_preview(text)
+            self._do_update_realtime_preview()
         elif op == "REALTIME_PREVIEW_HIDE":
             self._do_hide_realtime_preview()
         elif op == "GHOST_SHOW":
@@ -721,11 +766,14 @@ class CapsuleOverlay:
         elif op == "GHOST_HIDE":
             self._do_hide_ghost_menu()
         elif op == "VOLUME":
-            _, level = cmd
-            self._do_update_volume(level)
+            self._do_update_volume()
         elif op == "DURATION":
             _, duration, warning = cmd
             self._do_update_duration(duration, warning)
+        elif op == "SETUP_NOTICE":
+            _, delay_ms = cmd
+            if self._root is not None:
+                self._root.after(delay_ms, self._do_show_setup_complete_notice)
         elif op == "QUIT":
             self._do_quit()
 
@@ -871,8 +919,11 @@ class CapsuleOverlay:
                 canvas.itemconfigure(self._volume_bar_id, state="hidden")
                 canvas.itemconfigure(self._volume_bg_id, state="hidden")
 
-    def _do_update_volume(self, level: float) -> None:
-        """Update the volume bar based on audio level."""
+    def _do_update_volume(self) -> None:
+        """Update the volume bar to the latest audio level."""
+        # Clear the flag before reading so a concurrent update re-queues.
+        self._volume_update_queued = False
+        level = self._volume_level
         canvas = self._canvas
         if canvas is None:
             return
@@ -984,7 +1035,7 @@ class CapsuleOverlay:
                     try:
                         root.after_cancel(timer_id)
                     except Exception:
-                        logger.debug(f"Exception canceling {timer_name} timer")
+                        logger.debug("Exception canceling %s timer", timer_name)
                 # Clear the tracking variable
                 if timer_name == "poll":
                     self._poll_timer = None
@@ -1562,7 +1613,7 @@ class CapsuleOverlay:
 
     def _do_show_recording_personas(
         self,
-        personas: list[tuple[str, str, str]],
+        personas: Sequence[tuple[str, str, str]],
         x: int,
         y: int,
         on_click: Callable[[int], None] | None,
@@ -1789,14 +1840,21 @@ class CapsuleOverlay:
 
         self._realtime_preview_window = win
         self._realtime_preview_label = label
+        self._realtime_preview_shown = None
 
-    def _do_update_realtime_preview(self, text: str) -> None:
-        """Update the text in the realtime preview window."""
+    def _do_update_realtime_preview(self) -> None:
+        """Render the latest realtime preview text."""
+        # Clear the flag before reading so a concurrent update re-queues.
+        self._realtime_preview_update_queued = False
+        text = self._realtime_preview_text
         if self._realtime_preview_label is not None:
             # Truncate if too long for display
             max_len = 100
             display_text = text if len(text) <= max_len else text[:max_len] + "..."
-            self._realtime_preview_label.configure(text=display_text)
+            # Once the text outgrows the label, further updates look the same.
+            if display_text != self._realtime_preview_shown:
+                self._realtime_preview_label.configure(text=display_text)
+                self._realtime_preview_shown = display_text
 
     def _do_hide_realtime_preview(self) -> None:
         """Destroy the realtime preview window."""
@@ -1818,7 +1876,7 @@ class CapsuleOverlay:
         x: int,
         y: int,
         at_corner: bool,
-        personas: list[tuple[str, str, str]] | None = None,
+        personas: Sequence[tuple[str, str, str]] | None = None,
     ) -> None:
         """Create and show the editable staging area."""
         # If capsule is mid-flight, defer until the flight lands so the
@@ -2384,6 +2442,77 @@ class CapsuleOverlay:
                 pass
             self._ghost_mouse_listener = None
 
+    # ------------------------------------------------------------------
+    # Setup-complete notice (overlay thread only)
+    # ------------------------------------------------------------------
+
+    def _do_show_setup_complete_notice(self) -> None:
+        """Build the post-wizard toast at the bottom right of the screen."""
+        root = self._root
+        if root is None:
+            return
+
+        # Dark theme colors
+        bg_color = "#2d2d2d"
+        fg_color = "#e0e0e0"
+        accent_color = "#4CAF50"
+
+        win = tk.Toplevel(root)
+        win.configure(bg=bg_color)
+        win.withdraw()
+        win.attributes("-topmost", True)
+        win.attributes("-toolwindow", True)
+        win.overrideredirect(True)
+
+        main = tk.Frame(win, bg=bg_color, relief="solid", borderwidth=1)
+        main.pack(padx=0, pady=0)
+
+        content = tk.Frame(main, bg=bg_color)
+        content.pack(fill="both", expand=True, padx=20, pady=15)
+
+        top = tk.Frame(content, bg=bg_color)
+        top.pack(fill="x", pady=(0, 10))
+
+        tk.Label(
+            top,
+            text="✅ 配置完成！",
+            font=("Microsoft YaHei UI", 11, "bold"),
+            bg=bg_color,
+            fg=fg_color,
+        ).pack()
+
+        tk.Label(
+            content,
+            text="我在右下角状态栏 👇",
+            font=("Microsoft YaHei UI", 9),
+            bg=bg_color,
+            fg="#b0bec5",
+        ).pack(pady=(0, 5))
+
+        tk.Label(
+            content,
+            text="按 F6 开始使用",
+            font=("Microsoft YaHei UI", 9),
+            bg=bg_color,
+            fg=accent_color,
+        ).pack()
+
+        # Position at bottom right, above the taskbar
+        notice_w = 220
+        notice_h = 110
+        x = root.winfo_screenwidth() - notice_w - 15
+        y = root.winfo_screenheight() - notice_h - 50
+        win.geometry(f"{notice_w}x{notice_h}+{x}+{y}")
+        win.deiconify()
+
+        def _dismiss() -> None:
+            try:
+                win.destroy()
+            except tk.TclError:
+                pass
+
+        win.after(5000, _dismiss)
+
     # ------------------------------------------------------------------
     # Breathing animation (alpha pulse)
     # ------------------------------------------------------------------
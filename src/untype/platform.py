@@ -7,7 +7,7 @@ the correct backend based on ``sys.platform``.
 from __future__ import annotations
 
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 # ---------------------------------------------------------------------------
 # Shared data classes (platform-agnostic)
@@ -25,10 +25,14 @@ class CaretPosition:
 
 @dataclass(frozen=True)
 class WindowIdentity:
-    """Snapshot of a foreground window for later verification."""
+    """Snapshot of a foreground window for later verification.
+
+    Equality and hashing use only ``hwnd`` and ``pid``: a window's title can
+    change while it remains the same window.
+    """
 
     hwnd: int
-    title: str
+    title: str = field(compare=False)
     pid: int
 
 
@@ -38,17 +42,31 @@ class WindowIdentity:
 
 if sys.platform == "win32":
     from untype._platform_win32 import (
+        DigitKeyInterceptor,
+        ForegroundWatcher,
         get_caret_screen_position,
+        get_clipboard_sequence_number,
+        get_clipboard_text,
         get_foreground_window,
         get_modifier_key,
+        release_modifier_keys,
+        send_key_combo,
+        set_clipboard_text,
         set_window_noactivate,
         verify_foreground_window,
     )
 elif sys.platform == "darwin":
     from untype._platform_darwin import (
+        DigitKeyInterceptor,
+        ForegroundWatcher,
         get_caret_screen_position,
+        get_clipboard_sequence_number,
+        get_clipboard_text,
         get_foreground_window,
         get_modifier_key,
+        release_modifier_keys,
+        send_key_combo,
+        set_clipboard_text,
         set_window_noactivate,
         verify_foreground_window,
     )
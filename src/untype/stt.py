@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import io
 import logging
+import os
 import queue
 import threading
 import wave
@@ -14,6 +15,8 @@ from typing import Callable
 import httpx
 import numpy as np
 
+from untype.audio import normalize_audio
+
 logger = logging.getLogger(__name__)
 
 
@@ -57,8 +60,13 @@ class STTEngine:
 
         logger.info("Whisper model loaded successfully.")
 
-    def transcribe(self, audio: np.ndarray) -> str:
-        """Transcribe audio buffer to text."""
+    def transcribe(self, audio: np.ndarray, gain: float = 1.0) -> str:
+        """Transcribe audio buffer to text.
+
+        A *gain* other than 1.0 is applied (with clipping) to *audio* in place.
+        """
+        if gain != 1.0:
+            audio = normalize_audio(audio, gain, out=audio)
         segments, info = self._model.transcribe(
             audio,
             language=self._language,
@@ -70,10 +78,31 @@ class STTEngine:
         logger.info("Transcription (%s, %.2fs): %s", info.language, info.duration, text)
         return text
 
+    def close(self) -> None:
+        """Release the Whisper model."""
+        self._model = None
+
     @property
     def is_loaded(self) -> bool:
         return self._model is not None
 
+    @staticmethod
+    def is_model_cached(model_size: str) -> bool:
+        """Return whether the Whisper model is already in the Hugging Face cache.
+
+        Uses the same cache location as ``huggingface_hub`` (``HF_HUB_CACHE``,
+        ``HUGGINGFACE_HUB_CACHE``, ``HF_HOME`` or ``XDG_CACHE_HOME``) and
+        probes the repo's folder directly instead of listing the cache.
+        """
+        cache_dir = os.environ.get("HF_HUB_CACHE") or os.environ.get("HUGGINGFACE_HUB_CACHE")
+        if not cache_dir:
+            hf_home = os.environ.get("HF_HOME") or os.path.join(
+                os.environ.get("XDG_CACHE_HOME") or os.path.join("~", ".cache"), "huggingface"
+            )
+            cache_dir = os.path.join(hf_home, "hub")
+        model_dir = f"models--Systran--faster-whisper-{model_size}"
+        return os.path.isdir(os.path.join(os.path.expanduser(cache_dir), model_dir))
+
     @staticmethod
     def _detect_device() -> str:
         try:
@@ -113,9 +142,12 @@ class STTApiEngine:
         )
         logger.info("STT API engine ready (%s, model=%s)", self._base_url, self._model)
 
-    def transcribe(self, audio: np.ndarray) -> str:
-        """Transcribe audio buffer to text via API."""
-        wav_bytes = self._audio_to_wav(audio)
+    def transcribe(self, audio: np.ndarray, gain: float = 1.0) -> str:
+        """Transcribe audio buffer to text via API.
+
+        *gain* is applied while converting to 16-bit PCM; *audio* is not modified.
+        """
+        wav_bytes = self._audio_to_wav(audio, gain)
 
         response = None
         try:
@@ -147,15 +179,22 @@ class STTApiEngine:
     def is_loaded(self) -> bool:
         return True
 
-    def _audio_to_wav(self, audio: np.ndarray) -> bytes:
-        """Convert Float32 numpy audio to in-memory WAV bytes."""
-        pcm16 = (audio * 32767).clip(-32768, 32767).astype(np.int16)
+    def _audio_to_wav(self, audio: np.ndarray, gain: float = 1.0) -> bytes:
+        """Convert Float32 numpy audio to in-memory WAV bytes.
+
+        Gain, clipping to full scale and the int16 conversion share one
+        float32 scratch pass instead of separate normalise + convert passes.
+        """
+        scaled = np.multiply(audio, np.float32(gain * 32767.0), dtype=np.float32)
+        np.clip(scaled, -32767.0, 32767.0, out=scaled)
+        np.nan_to_num(scaled, copy=False, nan=0.0)
+        pcm16 = scaled.astype(np.int16)
         buf = io.BytesIO()
         with wave.open(buf, "wb") as wf:
             wf.setnchannels(1)
             wf.setsampwidth(2)
             wf.setframerate(self._sample_rate)
-            wf.writeframes(pcm16.tobytes())
+            wf.writeframes(pcm16)
         return buf.getvalue()
 
 
@@ -207,13 +246,16 @@ class STTRealtimeApiEngine:
             self._sample_rate,
         )
 
-    def transcribe(self, audio: np.ndarray) -> str:
+    def transcribe(self, audio: np.ndarray, gain: float = 1.0) -> str:
         """Transcribe audio buffer to text via realtime API.
 
         This sends the entire audio at once for compatibility with the existing
         pipeline interface. For true streaming, use start_session(), send_audio(),
-        and stop_session() instead.
+        and stop_session() instead.  A *gain* other than 1.0 is applied (with
+        clipping) to *audio* in place.
         """
+        if gain != 1.0:
+            audio = normalize_audio(audio, gain, out=audio)
         self.start_session()
         try:
             # Send audio in chunks (100ms = 1600 samples at 16kHz)
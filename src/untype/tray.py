@@ -16,8 +16,8 @@ import pystray
 from PIL import Image, ImageDraw
 
 from untype.build_info import HAS_LOCAL_STT
-from untype.config import AppConfig, save_config
-from untype.i18n import get_locale_display_name, list_available_locales, t
+from untype.config import AppConfig, copy_config, save_config
+from untype.i18n import get_language, get_locale_display_name, list_available_locales, t
 
 logger = logging.getLogger(__name__)
 
@@ -799,7 +799,6 @@ class SettingsDialog:
         lang_var: tk.StringVar,
     ) -> None:
         """Collect values from the dialog, persist, and notify the app."""
-        import copy
         import tkinter.messagebox as messagebox
 
         try:
@@ -847,7 +846,7 @@ class SettingsDialog:
 
         # Create a copy of the config to test save first
         # This prevents in-memory config corruption if save fails
-        config_copy = copy.deepcopy(self._config)
+        config_copy = copy_config(self._config)
 
         # Apply changes to the copy
         config_copy.hotkey.trigger = hotkey_var.get().strip()
@@ -935,6 +934,9 @@ class TrayApp:
         self._is_recording = is_recording
         self._on_rerun_wizard = on_rerun_wizard
         self._status: str = "Ready"
+        # (status, language) the icon was last drawn for; lets update_status
+        # skip redrawing when nothing visible would change.
+        self._rendered: tuple[str, str] | None = None
         self._icon: pystray.Icon | None = None
 
     # ------------------------------------------------------------------ #
@@ -958,6 +960,10 @@ class TrayApp:
         icon = self._icon
         if icon is None:
             return
+        rendered = (status, get_language())
+        if rendered == self._rendered:
+            return
+        self._rendered = rendered
 
         color = _STATUS_COLORS.get(status, _DEFAULT_ICON_COLOR)
         icon.icon = _create_icon_image(color)
@@ -10,7 +10,7 @@ from typing import Callable
 import httpx
 
 from untype.build_info import HAS_LOCAL_STT
-from untype.config import AppConfig, save_config
+from untype.config import AppConfig, copy_config, save_config
 from untype.stt import STTEngine, STTApiEngine, STTRealtimeApiEngine
 
 logger = logging.getLogger(__name__)
@@ -411,8 +411,7 @@ class SetupWizard:
 
         # Initialize temp config if needed
         if self._temp_config is None:
-            import copy
-            self._temp_config = copy.deepcopy(self._config)
+            self._temp_config = copy_config(self._config)
 
         # Selection variable
         if "stt_backend" not in self._page_vars:
@@ -794,8 +793,7 @@ class SetupWizard:
         """Get the appropriate Page 2 based on STT selection."""
         # Initialize temp config if needed
         if self._temp_config is None:
-            import copy
-            self._temp_config = copy.deepcopy(self._config)
+            self._temp_config = copy_config(self._config)
 
         backend_var = self._page_vars.get("stt_backend")
         if backend_var is None:
@@ -1283,15 +1281,7 @@ class SetupWizard:
     def _check_local_model_exists(self, model_size: str) -> bool:
         """Check if local model exists."""
         try:
-            cache_dir = os.path.expanduser("~/.cache/huggingface/hub")
-            if not os.path.exists(cache_dir):
-                return False
-
-            model_name = f"Systran/faster-whisper-{model_size}"
-            for item in os.listdir(cache_dir):
-                if model_name.replace("-", "_").replace("/", "--") in item or model_name in item:
-                    return True
-            return False
+            return STTEngine.is_model_cached(model_size)
         except Exception:
             return False
 